@@ -0,0 +1,65 @@
+"""
+Mide el tiempo de arranque de la línea de comandos frente al de la interfaz gráfica.
+
+Cada caso se ejecuta en un intérprete nuevo. Se comparan las importaciones
+que necesita cada entrada (cli frente a PyQt6 + ui.main_window) y el
+análisis completo de un archivo pequeño con `main.py analyze`.
+
+Uso:
+    python benchmarks/arranque_cli.py [repeticiones]
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASOS = [
+    ("Importar cli (numpy + pandas)", [sys.executable, '-c', 'import cli']),
+    ("Importar PyQt6 + ui.main_window",
+     [sys.executable, '-c', 'import PyQt6.QtWidgets, ui.main_window']),
+    ("main.py analyze (stdin, 100 datos)",
+     [sys.executable, 'main.py', 'analyze', '--format', 'json'])
+]
+
+
+def medir(comando, repeticiones: int, entrada: bytes = b''):
+    """Devuelve el mejor tiempo en milisegundos, o None si el comando falla."""
+    mejor = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        proceso = subprocess.run(comando, cwd=RAIZ, input=entrada,
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        transcurrido = (time.perf_counter() - inicio) * 1000
+        if proceso.returncode != 0:
+            return None
+        mejor = transcurrido if mejor is None else min(mejor, transcurrido)
+    return mejor
+
+
+def main():
+    """Ejecuta las mediciones e imprime los resultados."""
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    entrada = ", ".join(str(i % 37) for i in range(100)).encode()
+
+    base = medir([sys.executable, '-c', 'pass'], repeticiones)
+    print(f"{'Intérprete vacío:':38s} {base:8.1f} ms")
+    for nombre, comando in CASOS:
+        tiempo = medir(comando, repeticiones, entrada)
+        if tiempo is None:
+            print(f"{nombre + ':':38s} no disponible (falta el paquete)")
+        else:
+            print(f"{nombre + ':':38s} {tiempo:8.1f} ms")
+
+    # La línea de comandos no debe cargar la interfaz gráfica
+    comprobar = [sys.executable, '-c',
+                 "import sys, cli; print(any(m.split('.')[0] in ('PyQt6', 'matplotlib') "
+                 "for m in sys.modules))"]
+    cargados = subprocess.run(comprobar, cwd=RAIZ, capture_output=True, text=True).stdout.strip()
+    print(f"cli carga PyQt6 o matplotlib: {'sí' if cargados == 'True' else 'no'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Mide el tiempo hasta la primera ventana de la interfaz gráfica.
+
+Cada medición se hace en un intérprete nuevo: se crea la QApplication y la
+MainWindow, se muestra la ventana y se toma el tiempo cuando el ciclo de
+eventos procesa su primer evento. También se informa si matplotlib y pandas
+ya estaban cargados en ese momento (deberían cargarse solo al abrir una
+gráfica o al analizar datos).
+
+Uso:
+    python benchmarks/arranque_gui.py [repeticiones]
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Programa que se ejecuta en cada intérprete nuevo
+PROGRAMA = """
+import time
+inicio = time.perf_counter()
+import sys
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication
+from ui.main_window import MainWindow
+
+app = QApplication(sys.argv)
+ventana = MainWindow()
+ventana.show()
+
+def primera_ventana():
+    cargados = {m.split('.')[0] for m in sys.modules}
+    print((time.perf_counter() - inicio) * 1000, 'matplotlib' in cargados, 'pandas' in cargados)
+    app.quit()
+
+QTimer.singleShot(0, primera_ventana)
+app.exec()
+"""
+
+
+def medir(repeticiones: int):
+    """
+    Ejecuta el programa varias veces.
+
+    Returns:
+        Tupla (mejor tiempo interno en ms, mejor tiempo total del proceso en
+        ms, matplotlib cargado, pandas cargado), o None si PyQt6 no está
+        disponible
+    """
+    entorno = dict(os.environ)
+    entorno.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    mejores = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        proceso = subprocess.run([sys.executable, '-c', PROGRAMA], cwd=RAIZ, env=entorno,
+                                 capture_output=True, text=True)
+        total = (time.perf_counter() - inicio) * 1000
+        if proceso.returncode != 0:
+            return None
+        interno, matplotlib, pandas = proceso.stdout.split()[-3:]
+        medicion = (float(interno), total, matplotlib == 'True', pandas == 'True')
+        if mejores is None or medicion[0] < mejores[0]:
+            mejores = medicion
+    return mejores
+
+
+def main():
+    """Ejecuta la medición e imprime los resultados."""
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    resultado = medir(repeticiones)
+    if resultado is None:
+        print("No se pudo abrir la ventana (¿PyQt6 está instalado?).")
+        return
+    interno, total, matplotlib, pandas = resultado
+    print(f"Hasta la primera ventana (importaciones + MainWindow): {interno:8.1f} ms")
+    print(f"Proceso completo (incluye el intérprete):             {total:8.1f} ms")
+    print(f"matplotlib cargado al mostrar la ventana: {'sí' if matplotlib else 'no'}")
+    print(f"pandas cargado al mostrar la ventana:     {'sí' if pandas else 'no'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Compara la conversión de texto original (re.split + float) con la conversión en bloque.
+
+Uso:
+    python benchmarks/conversion_texto.py [n]
+"""
+
+import os
+import re
+import sys
+import timeit
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.conversion_texto import convertir_numeros
+
+
+def convertir_original(texto: str) -> np.ndarray:
+    """
+    Conversión que usaba DataInputWidget.validar_y_calcular, más el paso de
+    la lista a arreglo que luego hacía DistribucionFrecuencia.
+    """
+    elementos = re.split(r'[,\s\n]+', texto)
+    elementos = [e.strip() for e in elementos if e.strip()]
+    datos = []
+    for elemento in elementos:
+        datos.append(float(elemento))
+    return np.asarray(datos, dtype=np.float64)
+
+
+def medir(funcion, texto: str) -> float:
+    """Devuelve el mejor tiempo en milisegundos de una conversión."""
+    return min(timeit.repeat(lambda: funcion(texto), number=1, repeat=5)) * 1000
+
+
+def main():
+    """Ejecuta la comparación e imprime los resultados."""
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    valores = np.random.default_rng(0).normal(50, 10, n).round(2)
+    texto = "\n".join(", ".join(map(str, valores[i:i + 10])) for i in range(0, n, 10))
+
+    assert np.array_equal(convertir_numeros(texto), convertir_original(texto))
+    original = medir(convertir_original, texto)
+    en_bloque = medir(convertir_numeros, texto)
+    print(f"n = {n} números ({len(texto) / 1e6:.1f} MB de texto)")
+    print(f"Original (re.split + float): {original:8.1f} ms")
+    print(f"En bloque (np.fromstring):   {en_bloque:8.1f} ms")
+    print(f"Mejora:                      {original / en_bloque:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Compara el costo por conjunto de datos del modo detallado y del modo rápido.
+
+Uso:
+    python benchmarks/modo_rapido.py [n] [repeticiones]
+"""
+
+import os
+import sys
+import timeit
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.estadistica import AnalizadorEstadistico
+
+
+def medir(datos, detallado: bool, repeticiones: int) -> float:
+    """Devuelve el tiempo medio en milisegundos por análisis."""
+    def analizar():
+        AnalizadorEstadistico(datos, detallado=detallado).calcular_todo()
+    return min(timeit.repeat(analizar, number=repeticiones, repeat=5)) / repeticiones * 1000
+
+
+def main():
+    """Ejecuta la comparación e imprime los resultados."""
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    datos = np.random.default_rng(0).normal(50, 10, n).tolist()
+
+    detallado = medir(datos, True, repeticiones)
+    rapido = medir(datos, False, repeticiones)
+    print(f"n = {n}")
+    print(f"Modo detallado: {detallado:.3f} ms por conjunto")
+    print(f"Modo rápido:    {rapido:.3f} ms por conjunto")
+    print(f"Mejora:         {detallado / rapido:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+Interfaz de línea de comandos sin interfaz gráfica.
+
+Solo importa el paquete core (numpy y pandas); nunca carga PyQt6 ni
+matplotlib, de modo que se puede usar en servidores sin entorno gráfico.
+
+Uso:
+    python main.py analyze --input datos.csv otros.parquet --format json
+    cat datos.txt | python main.py analyze --format csv
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from typing import Dict, List, Optional
+from core.conversion_texto import convertir_numeros
+from core.estadistica import AnalizadorEstadistico
+from core.fuentes import abrir_binario
+from core.importacion import FORMATOS, importar_columna
+from core.reglas_clases import REGLAS
+
+# Columnas de la salida CSV (una fila por archivo)
+COLUMNAS_CSV = ['archivo', 'n', 'k', 'x_min', 'x_max', 'rango', 'amplitud', 'media',
+                'mediana', 'moda', 'desviacion_media', 'desviacion_estandar', 'fi']
+
+# Extensiones que se abren como arreglos binarios mapeados en memoria
+EXTENSIONES_BINARIAS = ('.npy', '.bin')
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    """Construye el parser de argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        prog="python main.py",
+        description="Analizador Estadístico - Datos Agrupados (sin interfaz gráfica)"
+    )
+    subcomandos = parser.add_subparsers(dest='comando', required=True)
+
+    analizar = subcomandos.add_parser(
+        'analyze', aliases=['analizar'],
+        help="Analiza uno o varios archivos (o la entrada estándar)"
+    )
+    analizar.add_argument(
+        '-i', '--input', dest='entradas', nargs='+', action='extend', default=[],
+        metavar='ARCHIVO',
+        help="Archivos CSV, Excel, Parquet, .npy/.bin o de texto ('-' = entrada estándar)"
+    )
+    analizar.add_argument('-f', '--format', dest='formato', choices=['json', 'csv'],
+                          default='json', help="Formato de salida (JSON: un objeto por línea)")
+    analizar.add_argument('--regla', choices=sorted(REGLAS), default='sturges',
+                          help="Regla del número de clases")
+    analizar.add_argument('--columna', help="Columna a analizar en CSV, Excel o Parquet")
+    analizar.add_argument('--separador',
+                          help="Separador de columnas de los CSV (por defecto se detecta: ';', "
+                               "tabulador o ',')")
+    analizar.add_argument('--coma-decimal', action='store_true',
+                          help="En texto, la coma es el separador decimal (1,5)")
+    analizar.add_argument('--procesos', type=int, default=1,
+                          help="Procesos para el conteo de frecuencias (0 = todos los núcleos)")
+    return parser
+
+
+def leer_datos(entrada: str, argumentos: argparse.Namespace):
+    """
+    Lee los valores de un archivo o de la entrada estándar.
+
+    En CSV, Excel y Parquet las filas vacías, no numéricas o no finitas se
+    descartan (como al importar en la interfaz) y su cantidad se informa en
+    la salida de errores; en texto un valor inválido es un error.
+
+    Args:
+        entrada: Ruta del archivo o '-' para la entrada estándar
+        argumentos: Opciones de la línea de comandos
+
+    Returns:
+        Arreglo de valores numéricos
+    """
+    if entrada == '-':
+        return convertir_numeros(sys.stdin.read(), argumentos.coma_decimal)
+
+    extension = os.path.splitext(entrada)[1].lower()
+    if extension in EXTENSIONES_BINARIAS:
+        return abrir_binario(entrada)
+    if extension in FORMATOS and extension != '.txt':
+        datos, resumen = importar_columna(entrada, argumentos.columna, argumentos.separador)
+        if resumen['filas_descartadas']:
+            print(f"{entrada}: {resumen['filas_descartadas']:,} de {resumen['filas_leidas']:,} "
+                  "filas descartadas (vacías, no numéricas o no finitas)", file=sys.stderr)
+        return datos
+    with open(entrada, 'r', encoding='utf-8') as archivo:
+        return convertir_numeros(archivo.read(), argumentos.coma_decimal)
+
+
+def analizar_datos(datos, regla: str = 'sturges', procesos: Optional[int] = 1) -> Dict:
+    """
+    Analiza los datos en modo rápido y devuelve los valores para la salida.
+
+    Args:
+        datos: Valores numéricos
+        regla: Regla del número de clases
+        procesos: Número de procesos para el conteo (None = todos los núcleos)
+
+    Returns:
+        Diccionario con n, k, extremos, amplitud, medidas y fi
+    """
+    if len(datos) < 5:
+        raise ValueError(f"Se necesitan al menos 5 datos. Hay {len(datos)}.")
+    analizador = AnalizadorEstadistico(datos, procesos, detallado=False, regla=regla)
+    valores = analizador.obtener_valores()
+    parametros = analizador.resultados['distribucion']['parametros']
+    return {
+        'n': int(valores['n']),
+        'k': int(valores['k']),
+        'x_min': float(parametros['x_min']),
+        'x_max': float(parametros['x_max']),
+        'rango': float(parametros['rango']),
+        'amplitud': float(valores['amplitud']),
+        'media': float(valores['media']),
+        'mediana': float(valores['mediana']),
+        'moda': float(valores['moda']),
+        'desviacion_media': float(valores['desviacion_media']),
+        'desviacion_estandar': float(valores['desviacion_estandar']),
+        'fi': [int(f) for f in valores['fi']]
+    }
+
+
+def analyze(argumentos: argparse.Namespace) -> int:
+    """
+    Analiza cada entrada y escribe un resultado por entrada en la salida estándar.
+
+    Cada resultado se escribe en cuanto está listo. Los errores de una
+    entrada se informan en la salida de errores y no detienen las demás.
+
+    Returns:
+        Código de salida (0 si todas las entradas se analizaron, 1 si alguna falló)
+    """
+    entradas = argumentos.entradas or ['-']
+    procesos = None if argumentos.procesos == 0 else argumentos.procesos
+    escritor = None
+    if argumentos.formato == 'csv':
+        escritor = csv.DictWriter(sys.stdout, fieldnames=COLUMNAS_CSV, lineterminator='\n')
+        escritor.writeheader()
+
+    codigo = 0
+    for entrada in entradas:
+        nombre = '<stdin>' if entrada == '-' else entrada
+        try:
+            resultado = analizar_datos(leer_datos(entrada, argumentos), argumentos.regla,
+                                       procesos)
+        except (OSError, ValueError, ImportError, ArithmeticError) as e:
+            print(f"{nombre}: {e}", file=sys.stderr)
+            codigo = 1
+            continue
+
+        resultado = {'archivo': nombre, **resultado}
+        if escritor is not None:
+            escritor.writerow({**resultado, 'fi': ' '.join(map(str, resultado['fi']))})
+        else:
+            sys.stdout.write(json.dumps(resultado, ensure_ascii=False) + '\n')
+        sys.stdout.flush()
+    return codigo
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """
+    Ejecuta la línea de comandos.
+
+    Args:
+        args: Argumentos (por defecto los de sys.argv)
+
+    Returns:
+        Código de salida
+    """
+    argumentos = crear_parser().parse_args(args)
+    return analyze(argumentos)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+"""
+Módulo con la caché de resultados direccionada por contenido.
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, Optional
+
+# Bytes que se hashean por bloque (evita copiar arreglos grandes completos)
+BLOQUE_HASH = 1 << 24
+
+
+class CacheResultados:
+    """
+    Caché LRU de resultados de calcular_todo con un nivel opcional en disco.
+
+    La clave es un hash BLAKE2 del contenido de los datos (como float64) más
+    los parámetros de agrupación, de modo que los mismos datos devuelven los
+    resultados guardados sin recalcular. El nivel en memoria tiene un límite
+    de bytes y descarta primero lo menos usado recientemente.
+
+    Los resultados se guardan serializados, por lo que cada consulta devuelve
+    una copia nueva: modificar lo devuelto no altera la entrada guardada.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, directorio: Optional[str] = None):
+        """
+        Inicializa la caché.
+
+        Args:
+            max_bytes: Límite de bytes del nivel en memoria
+            directorio: Carpeta del nivel en disco (None = sin nivel en disco)
+        """
+        self.max_bytes = max_bytes
+        self.directorio = directorio
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+
+        self._memoria = OrderedDict()   # clave -> resultados serializados (pickle)
+        self._lock = threading.Lock()
+        self.bytes_usados = 0
+        self.aciertos = 0
+        self.aciertos_disco = 0
+        self.fallos = 0
+
+    @staticmethod
+    def clave(datos, pesos=None, **parametros) -> str:
+        """
+        Calcula la clave de caché de unos datos y sus parámetros.
+
+        Args:
+            datos: Valores numéricos (lista o arreglo)
+            pesos: Frecuencia de cada valor, si los datos vienen resumidos
+            **parametros: Parámetros de agrupación que afectan al resultado
+
+        Returns:
+            Hash hexadecimal
+        """
+        h = hashlib.blake2b(digest_size=20)
+        h.update(repr(sorted(parametros.items())).encode('utf-8'))
+        CacheResultados._actualizar_hash(h, datos, np.float64)
+        if pesos is not None:
+            h.update(b'pesos')
+            CacheResultados._actualizar_hash(h, pesos, np.int64)
+        return h.hexdigest()
+
+    @staticmethod
+    def _actualizar_hash(h, arreglo, tipo):
+        """Agrega la longitud y el contenido de un arreglo al hash, por bloques."""
+        if not isinstance(arreglo, np.ndarray):
+            arreglo = np.asarray(arreglo, dtype=tipo)
+        h.update(str(len(arreglo)).encode('utf-8'))
+        paso = max(1, BLOQUE_HASH // 8)
+        for inicio in range(0, len(arreglo), paso):
+            bloque = np.ascontiguousarray(arreglo[inicio:inicio + paso], dtype=tipo)
+            h.update(memoryview(bloque).cast('B'))
+
+    def obtener(self, clave: str) -> Optional[Dict]:
+        """
+        Busca unos resultados en la caché.
+
+        Args:
+            clave: Clave calculada con CacheResultados.clave
+
+        Returns:
+            Copia de los resultados guardados o None si no están
+        """
+        with self._lock:
+            contenido = self._memoria.get(clave)
+            if contenido is not None:
+                self._memoria.move_to_end(clave)
+                self.aciertos += 1
+        if contenido is not None:
+            return pickle.loads(contenido)
+
+        ruta = self._ruta(clave)
+        if ruta and os.path.exists(ruta):
+            try:
+                with open(ruta, 'rb') as archivo:
+                    contenido = archivo.read()
+                resultados = pickle.loads(contenido)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                resultados = None
+            if resultados is not None:
+                with self._lock:
+                    self.aciertos += 1
+                    self.aciertos_disco += 1
+                    self._guardar_en_memoria(clave, contenido)
+                return resultados
+
+        with self._lock:
+            self.fallos += 1
+        return None
+
+    def guardar(self, clave: str, resultados: Dict):
+        """
+        Guarda unos resultados en la caché (memoria y, si existe, disco).
+
+        Args:
+            clave: Clave calculada con CacheResultados.clave
+            resultados: Diccionario devuelto por calcular_todo (sin los datos;
+                        ver AnalizadorEstadistico._resultados_para_cache)
+        """
+        contenido = pickle.dumps(resultados, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._guardar_en_memoria(clave, contenido)
+
+        ruta = self._ruta(clave)
+        if ruta:
+            temporal = ruta + '.tmp'
+            with open(temporal, 'wb') as archivo:
+                archivo.write(contenido)
+            os.replace(temporal, ruta)
+
+    def limpiar(self):
+        """Vacía el nivel en memoria y reinicia los contadores."""
+        with self._lock:
+            self._memoria.clear()
+            self.bytes_usados = 0
+            self.aciertos = self.aciertos_disco = self.fallos = 0
+
+    def estadisticas(self) -> Dict:
+        """
+        Devuelve los contadores de uso de la caché.
+
+        Returns:
+            Diccionario con aciertos, fallos, entradas y bytes en memoria
+        """
+        with self._lock:
+            return {
+                'aciertos': self.aciertos,
+                'aciertos_disco': self.aciertos_disco,
+                'fallos': self.fallos,
+                'entradas': len(self._memoria),
+                'bytes_usados': self.bytes_usados,
+                'max_bytes': self.max_bytes
+            }
+
+    def _guardar_en_memoria(self, clave: str, contenido: bytes):
+        """Inserta en el nivel en memoria y descarta las entradas más antiguas."""
+        if clave in self._memoria:
+            self.bytes_usados -= len(self._memoria.pop(clave))
+        if len(contenido) > self.max_bytes:
+            return
+        self._memoria[clave] = contenido
+        self.bytes_usados += len(contenido)
+        while self.bytes_usados > self.max_bytes:
+            _, liberado = self._memoria.popitem(last=False)
+            self.bytes_usados -= len(liberado)
+
+    def _ruta(self, clave: str) -> Optional[str]:
+        """Ruta del archivo de la clave en el nivel en disco."""
+        if not self.directorio:
+            return None
+        return os.path.join(self.directorio, f"{clave}.pkl")
@@ -0,0 +1,197 @@
+"""
+Módulo para analizar varias columnas de datos en paralelo.
+"""
+
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple
+from .estadistica import AnalizadorEstadistico
+from .paralelo import MINIMO_PARALELO, resolver_procesos
+
+# Columnas del buffer compartido visibles en cada proceso de trabajo
+_columnas_compartidas = None
+_memoria_compartida = None
+
+
+def _adjuntar_buffer(nombre: str, forma: Tuple[int, int]):
+    """Inicializador de cada proceso: mapea el buffer compartido sin copiarlo."""
+    global _columnas_compartidas, _memoria_compartida
+    _memoria_compartida = shared_memory.SharedMemory(name=nombre)
+    _columnas_compartidas = np.ndarray(forma, dtype=np.float64, buffer=_memoria_compartida.buf)
+
+
+def _valores_validos(columna: np.ndarray) -> np.ndarray:
+    """Quita los NaN de una columna (sin copiar si no hay)."""
+    faltantes = np.isnan(columna)
+    return columna[~faltantes] if faltantes.any() else columna
+
+
+def _resumen_vacio() -> Dict:
+    """Fila del resumen de una columna sin valores o que no se puede analizar."""
+    return {
+        'n': 0,
+        'k': 0,
+        'amplitud': np.nan,
+        'media': np.nan,
+        'mediana': np.nan,
+        'moda': np.nan,
+        'desviacion_media': np.nan,
+        'desviacion_estandar': np.nan,
+        'fi': np.zeros(0, dtype=np.int64)
+    }
+
+
+def _resumir_columna(columna: np.ndarray, regla: str) -> Dict:
+    """
+    Calcula los valores numéricos de una columna (sin NaN) en modo rápido.
+
+    Un error en una columna (por ejemplo, un valor infinito) no detiene el
+    resumen de las demás: la columna se informa como vacía.
+    """
+    if len(columna) == 0:
+        return _resumen_vacio()
+    try:
+        analizador = AnalizadorEstadistico(columna, detallado=False, regla=regla)
+        return analizador.obtener_valores()
+    except (ValueError, ArithmeticError):
+        return _resumen_vacio()
+
+
+def _resumir_columna_compartida(indice: int, longitud: int, regla: str) -> Dict:
+    """Resume la columna indicada del buffer compartido (en cada proceso)."""
+    return _resumir_columna(_columnas_compartidas[indice, :longitud], regla)
+
+
+class AnalizadorColumnas:
+    """
+    Analizador de muchas columnas a la vez (una distribución por columna).
+
+    Las columnas se guardan en un único buffer float64 por columnas (cada
+    columna contigua, sin sus NaN y rellenada con NaN al final si es más
+    corta), junto con la cantidad de valores válidos de cada una. Al calcular el
+    resumen, el buffer se copia una sola vez a memoria compartida y cada
+    proceso de trabajo lo mapea y analiza sus columnas sobre vistas, sin
+    recibir copias de los datos. Los resultados completos de una columna
+    (tablas y pasos) se calculan solo cuando se piden.
+    """
+
+    def __init__(self, datos, nombres: Optional[Sequence[str]] = None,
+                 procesos: Optional[int] = None, regla: str = 'sturges'):
+        """
+        Inicializa el analizador con las columnas.
+
+        Args:
+            datos: DataFrame, diccionario nombre -> valores, o arreglo 2-D
+                   (filas × columnas)
+            nombres: Nombres de las columnas (por defecto los del DataFrame o
+                     diccionario, o 'Columna 1', 'Columna 2', ...)
+            procesos: Número de procesos (None = todos los núcleos, 1 = serial)
+            regla: Regla del número de clases para todas las columnas
+        """
+        if isinstance(datos, pd.DataFrame):
+            nombres = nombres or [str(c) for c in datos.columns]
+            columnas = [datos[c].to_numpy(dtype=np.float64) for c in datos.columns]
+        elif isinstance(datos, dict):
+            nombres = nombres or [str(c) for c in datos.keys()]
+            columnas = [np.asarray(v, dtype=np.float64).ravel() for v in datos.values()]
+        else:
+            matriz = np.asarray(datos, dtype=np.float64)
+            if matriz.ndim != 2:
+                raise ValueError("Los datos deben tener dos dimensiones (filas × columnas).")
+            columnas = list(matriz.T)
+            nombres = nombres or [f"Columna {i + 1}" for i in range(len(columnas))]
+
+        if len(nombres) != len(columnas):
+            raise ValueError("La cantidad de nombres no coincide con la de columnas.")
+        if not columnas:
+            raise ValueError("No hay columnas para analizar.")
+
+        # Los NaN (celdas vacías) se quitan aquí, una sola vez: cada columna
+        # queda en los primeros longitudes[i] valores de su fila del buffer
+        columnas = [_valores_validos(c) for c in columnas]
+        self.longitudes = [len(c) for c in columnas]
+        self.buffer = np.full((len(columnas), max(max(self.longitudes), 1)), np.nan)
+        for i, columna in enumerate(columnas):
+            self.buffer[i, :len(columna)] = columna
+
+        self.nombres = list(nombres)
+        self.procesos = procesos
+        self.regla = regla
+        self._resumen = None
+        self._analizadores = {}
+
+    def resumen(self) -> pd.DataFrame:
+        """
+        Calcula (una vez) los valores de todas las columnas.
+
+        Returns:
+            DataFrame con una fila por columna y las columnas n, k, amplitud,
+            media, mediana, moda, desviacion_media, desviacion_estandar y fi
+            (las columnas sin valores o con valores infinitos tienen n = 0 y
+            medidas NaN)
+        """
+        if self._resumen is None:
+            procesos = min(resolver_procesos(self.procesos), len(self.nombres))
+            if procesos == 1 or self.buffer.size < MINIMO_PARALELO:
+                valores = [_resumir_columna(columna[:longitud], self.regla)
+                           for columna, longitud in zip(self.buffer, self.longitudes)]
+            else:
+                valores = self._resumir_en_paralelo(procesos)
+            self._resumen = pd.DataFrame(valores, index=pd.Index(self.nombres, name='columna'))
+        return self._resumen
+
+    def _resumir_en_paralelo(self, procesos: int) -> List[Dict]:
+        """Reparte las columnas entre procesos que comparten el buffer."""
+        memoria = shared_memory.SharedMemory(create=True, size=self.buffer.nbytes)
+        compartido = np.ndarray(self.buffer.shape, dtype=np.float64, buffer=memoria.buf)
+        try:
+            compartido[:] = self.buffer
+            with ProcessPoolExecutor(max_workers=procesos, initializer=_adjuntar_buffer,
+                                     initargs=(memoria.name, self.buffer.shape)) as ejecutor:
+                return list(ejecutor.map(_resumir_columna_compartida, range(len(self.nombres)),
+                                         self.longitudes, repeat(self.regla)))
+        finally:
+            del compartido
+            memoria.close()
+            memoria.unlink()
+
+    def analizador(self, nombre: str) -> AnalizadorEstadistico:
+        """
+        Devuelve el analizador completo de una columna (se calcula al pedirlo).
+
+        Args:
+            nombre: Nombre de la columna
+
+        Returns:
+            AnalizadorEstadistico con calcular_todo ya ejecutado
+
+        Raises:
+            KeyError: Si no existe la columna
+            ValueError: Si la columna no tiene valores
+        """
+        if nombre not in self._analizadores:
+            if nombre not in self.nombres:
+                raise KeyError(f"No existe la columna '{nombre}'.")
+            indice = self.nombres.index(nombre)
+            if self.longitudes[indice] == 0:
+                raise ValueError(f"La columna '{nombre}' no tiene valores.")
+            columna = self.buffer[indice, :self.longitudes[indice]]
+            analizador = AnalizadorEstadistico(columna, regla=self.regla)
+            analizador.calcular_todo()
+            self._analizadores[nombre] = analizador
+        return self._analizadores[nombre]
+
+    def resultados(self, nombre: str) -> Dict:
+        """
+        Devuelve los resultados completos de una columna (como calcular_todo).
+
+        Args:
+            nombre: Nombre de la columna
+
+        Returns:
+            Diccionario con todos los resultados y pasos de la columna
+        """
+        return self.analizador(nombre).resultados
@@ -0,0 +1,190 @@
+"""
+Módulo con las rutinas vectorizadas de conteo de frecuencias por intervalo.
+"""
+
+import numpy as np
+from typing import Callable, List, Optional, Tuple
+
+# Cantidad de datos que se procesan por bloque al contar
+TAMANO_BLOQUE = 1 << 20
+
+# Máximo de valores enteros distintos posibles (x_max - x_min + 1) para usar
+# el conteo directo con bincount; por encima el arreglo de conteos no compensa
+MAXIMO_RANGO_ENTEROS = 1 << 22
+
+# Función de avance del conteo: recibe la fracción de datos ya contada (0 a 1).
+# Si lanza una excepción el conteo se interrumpe en ese bloque.
+Avance = Callable[[float], None]
+
+
+def umbrales_intervalos(intervalos: List[Tuple[float, float]]) -> np.ndarray:
+    """
+    Construye los umbrales de comparación para un conjunto de intervalos.
+
+    Los primeros k umbrales son los límites inferiores y los k siguientes los
+    límites superiores. Como el último intervalo es cerrado [li, ls], su límite
+    superior se sustituye por el siguiente flotante representable, de modo que
+    "x <= ls" equivale exactamente a "x < umbral".
+
+    Args:
+        intervalos: Lista de tuplas (límite_inferior, límite_superior)
+
+    Returns:
+        Arreglo float64 de longitud 2k con los umbrales
+    """
+    limites = np.asarray(intervalos, dtype=np.float64).reshape(-1, 2)
+    inferiores = limites[:, 0]
+    superiores = limites[:, 1].copy()
+    superiores[-1] = np.nextafter(superiores[-1], np.inf)
+    return np.concatenate([inferiores, superiores])
+
+
+def contar_menores(datos, umbrales: np.ndarray, pesos=None, momentos=None,
+                   avance: Optional[Avance] = None) -> np.ndarray:
+    """
+    Cuenta, para cada umbral u, cuántos datos cumplen x < u.
+
+    Se hace una sola pasada de searchsorted sobre los datos contra los umbrales
+    ordenados y un bincount de las posiciones, por lo que el costo es
+    O(n log k) sin necesidad de que los datos estén ordenados. Los arreglos
+    (incluidos los mapeados en memoria) se recorren por bloques, de modo que
+    los temporales no dependen de n.
+
+    Args:
+        datos: Valores numéricos (lista o arreglo)
+        umbrales: Arreglo de umbrales
+        pesos: Repeticiones enteras de cada valor (opcional)
+        momentos: Estado de Momentos que se actualiza con cada bloque en la
+                  misma pasada del conteo (opcional)
+        avance: Función que se llama después de cada bloque (opcional)
+
+    Returns:
+        Arreglo int64 con el conteo de datos menores a cada umbral
+    """
+    if not isinstance(datos, np.ndarray):
+        datos = np.asarray(datos, dtype=np.float64)
+    orden = np.argsort(umbrales, kind='stable')
+    ordenados = umbrales[orden]
+
+    conteos = np.zeros(len(umbrales) + 1, dtype=np.int64)
+    for inicio in range(0, len(datos), TAMANO_BLOQUE):
+        bloque = np.asarray(datos[inicio:inicio + TAMANO_BLOQUE], dtype=np.float64)
+        pesos_bloque = None if pesos is None else pesos[inicio:inicio + TAMANO_BLOQUE]
+        if momentos is not None:
+            momentos.actualizar(bloque, pesos_bloque)
+
+        # posicion(x) = cantidad de umbrales <= x, y x < ordenados[j] <=> posicion(x) <= j
+        posiciones = np.searchsorted(ordenados, bloque, side='right')
+        if pesos is None:
+            conteos += np.bincount(posiciones, minlength=len(umbrales) + 1)
+        else:
+            parciales = np.bincount(posiciones, weights=pesos_bloque, minlength=len(umbrales) + 1)
+            conteos += np.rint(parciales).astype(np.int64)
+        if avance is not None:
+            avance(min(1.0, (inicio + TAMANO_BLOQUE) / len(datos)))
+    acumulado = np.cumsum(conteos)
+
+    menores = np.empty(len(umbrales), dtype=np.int64)
+    menores[orden] = acumulado[:len(umbrales)]
+    return menores
+
+
+def admite_conteo_enteros(datos, x_min: float, x_max: float, verificar: bool = True) -> bool:
+    """
+    Indica si los datos son enteros en un rango que admite el conteo directo.
+
+    Los arreglos de tipo entero se aceptan sin revisarlos; los de punto
+    flotante se revisan por bloques y la revisión se detiene en el primer
+    bloque con un valor no entero.
+
+    Args:
+        datos: Valores numéricos
+        x_min: Valor mínimo de los datos
+        x_max: Valor máximo de los datos
+        verificar: Si es False no se revisan los valores (el llamador
+                   garantiza que son enteros); solo se comprueba el rango
+
+    Returns:
+        True si se puede usar contar_menores_enteros
+    """
+    if not (float(x_min).is_integer() and float(x_max).is_integer()):
+        return False
+    longitud = x_max - x_min + 1
+    if longitud > MAXIMO_RANGO_ENTEROS or longitud > 4 * len(datos) + 1024:
+        return False
+
+    if not isinstance(datos, np.ndarray):
+        datos = np.asarray(datos, dtype=np.float64)
+    if not verificar or datos.dtype.kind in 'iu':
+        return True
+    for inicio in range(0, len(datos), TAMANO_BLOQUE):
+        bloque = datos[inicio:inicio + TAMANO_BLOQUE]
+        if not np.array_equal(bloque, np.trunc(bloque)):
+            return False
+    return True
+
+
+def contar_menores_enteros(datos, umbrales: np.ndarray, x_min: float, x_max: float,
+                           pesos=None, momentos=None,
+                           avance: Optional[Avance] = None) -> np.ndarray:
+    """
+    Versión de contar_menores para datos enteros basada en bincount.
+
+    Cuenta cada valor de [x_min, x_max] con un bincount (O(n), sin
+    búsquedas) y luego pliega esos conteos en los umbrales: #(x < u) es la
+    suma de los conteos de los enteros menores que u. El resultado es
+    idéntico al de contar_menores (ver admite_conteo_enteros).
+
+    Args:
+        datos: Valores enteros (en arreglo entero o de punto flotante)
+        umbrales: Arreglo de umbrales
+        x_min: Valor mínimo de los datos
+        x_max: Valor máximo de los datos
+        pesos: Repeticiones enteras de cada valor (opcional)
+        momentos: Estado de Momentos que se actualiza con los conteos (opcional)
+        avance: Función que se llama después de cada bloque (opcional)
+
+    Returns:
+        Arreglo int64 con el conteo de datos menores a cada umbral
+    """
+    if not isinstance(datos, np.ndarray):
+        datos = np.asarray(datos, dtype=np.float64)
+    base = int(x_min)
+    longitud = int(x_max) - base + 1
+
+    conteos = np.zeros(longitud, dtype=np.int64)
+    for inicio in range(0, len(datos), TAMANO_BLOQUE):
+        posiciones = datos[inicio:inicio + TAMANO_BLOQUE].astype(np.int64) - base
+        if pesos is None:
+            conteos += np.bincount(posiciones, minlength=longitud)
+        else:
+            pesos_bloque = pesos[inicio:inicio + TAMANO_BLOQUE]
+            conteos += np.rint(np.bincount(posiciones, weights=pesos_bloque,
+                                           minlength=longitud)).astype(np.int64)
+        if avance is not None:
+            avance(min(1.0, (inicio + TAMANO_BLOQUE) / len(datos)))
+
+    # Los momentos se obtienen de los mismos conteos (cada entero con su peso)
+    if momentos is not None:
+        momentos.actualizar(np.arange(longitud, dtype=np.float64) + base, conteos)
+
+    # acumulado[j] = cantidad de datos menores que base + j
+    acumulado = np.zeros(longitud + 1, dtype=np.int64)
+    np.cumsum(conteos, out=acumulado[1:])
+    # Para x entero, x < u equivale a x < ceil(u)
+    indices = np.clip(np.ceil(umbrales).astype(np.int64) - base, 0, longitud)
+    return acumulado[indices]
+
+
+def frecuencias_desde_menores(menores: np.ndarray) -> np.ndarray:
+    """
+    Obtiene la frecuencia absoluta de cada intervalo a partir de los conteos.
+
+    Args:
+        menores: Conteos devueltos por contar_menores para umbrales_intervalos
+
+    Returns:
+        Arreglo int64 con fi para cada intervalo
+    """
+    k = len(menores) // 2
+    return menores[k:] - menores[:k]
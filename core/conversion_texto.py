@@ -0,0 +1,131 @@
+"""
+Módulo para convertir texto con muchos números a un arreglo float64.
+"""
+
+import re
+import warnings
+import numpy as np
+
+# Traducción de los separadores a espacios (y de la coma decimal a punto)
+_TRADUCCION = {
+    False: str.maketrans({',': ' '}),
+    True: str.maketrans({';': ' ', ',': '.'})
+}
+
+# Bytes de espacio en blanco (los separadores que reconoce np.fromstring)
+_ESPACIOS = np.zeros(256, dtype=bool)
+_ESPACIOS[list(b' \t\n\r\x0b\x0c')] = True
+
+# Elementos del texto: todo lo que no es separador
+_ELEMENTOS = {
+    False: re.compile(r'[^,\s]+'),
+    True: re.compile(r'[^;\s]+')
+}
+
+
+class ErrorFormato(ValueError):
+    """Error de un elemento del texto que no es un número válido."""
+
+    def __init__(self, elemento: str, linea: int, columna: int):
+        """
+        Args:
+            elemento: Texto del elemento inválido
+            linea: Número de línea (desde 1)
+            columna: Columna del primer carácter del elemento (desde 1)
+        """
+        super().__init__(
+            f"El valor '{elemento}' (línea {linea}, columna {columna}) no es un número válido."
+        )
+        self.elemento = elemento
+        self.linea = linea
+        self.columna = columna
+
+
+def _convertir_elemento(elemento: str, coma_decimal: bool) -> float:
+    """Convierte un elemento con float()."""
+    if coma_decimal:
+        if '.' in elemento:
+            raise ValueError(elemento)
+        elemento = elemento.replace(',', '.')
+    return float(elemento)
+
+
+def contar_elementos(traducido: str) -> int:
+    """
+    Cuenta los elementos de un texto ya traducido (separados por espacios).
+
+    Se cuentan en bloque los inicios de elemento (un byte que no es espacio
+    precedido por uno que sí lo es), sin crear un objeto por elemento.
+    """
+    contenido = np.frombuffer(traducido.encode('utf-8'), dtype=np.uint8)
+    if len(contenido) == 0:
+        return 0
+    espacio = _ESPACIOS[contenido]
+    return int(np.count_nonzero(espacio[:-1] & ~espacio[1:])) + int(not espacio[0])
+
+
+def buscar_error(texto: str, coma_decimal: bool = False):
+    """
+    Recorre el texto y lanza ErrorFormato en el primer elemento inválido.
+
+    Es la revisión lenta (un float() por elemento) que solo se hace cuando
+    la conversión en bloque falla.
+
+    Args:
+        texto: Texto con los números
+        coma_decimal: Si es True la coma es el separador decimal
+
+    Raises:
+        ErrorFormato: Con la línea y la columna del primer elemento inválido
+    """
+    for numero, linea in enumerate(texto.split('\n'), start=1):
+        for coincidencia in _ELEMENTOS[coma_decimal].finditer(linea):
+            try:
+                _convertir_elemento(coincidencia.group(), coma_decimal)
+            except ValueError:
+                raise ErrorFormato(coincidencia.group(), numero, coincidencia.start() + 1)
+
+
+def convertir_numeros(texto: str, coma_decimal: bool = False) -> np.ndarray:
+    """
+    Convierte un texto con números separados a un arreglo float64.
+
+    Los separadores se traducen a espacios y todo el texto se convierte con
+    una sola llamada a np.fromstring (en C, sin crear un objeto de Python
+    por número). Los valores son los mismos que daría float(). Solo si esa
+    conversión falla o no convierte todos los elementos se recorre el texto
+    elemento por elemento para informar la posición del primer valor
+    inválido.
+
+    Args:
+        texto: Números separados por comas, espacios o saltos de línea (con
+               coma_decimal, por punto y coma, espacios o saltos de línea)
+        coma_decimal: Si es True la coma es el separador decimal (1,5)
+
+    Returns:
+        Arreglo float64 con los números en el orden del texto
+
+    Raises:
+        ErrorFormato: Si algún elemento no es un número válido
+    """
+    traducido = texto.translate(_TRADUCCION[coma_decimal])
+    if not traducido.strip():
+        return np.empty(0, dtype=np.float64)
+    if not (coma_decimal and '.' in texto):
+        # En numpy 1.x un elemento inválido no lanza ValueError: la conversión
+        # se detiene con un DeprecationWarning y devuelve un arreglo truncado.
+        # Por eso el aviso se trata como error y se comprueba la cantidad.
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('error', DeprecationWarning)
+                datos = np.fromstring(traducido, sep=' ')
+            if len(datos) == contar_elementos(traducido):
+                return datos
+        except (ValueError, DeprecationWarning):
+            pass
+
+    # Ruta general: localiza el primer elemento inválido, o convierte con
+    # float() los que np.fromstring no admite (por ejemplo '1_000')
+    buscar_error(texto, coma_decimal)
+    elementos = _ELEMENTOS[coma_decimal].findall(texto)
+    return np.array([_convertir_elemento(e, coma_decimal) for e in elementos], dtype=np.float64)
@@ -0,0 +1,83 @@
+"""
+Módulo con la vista perezosa de los datos ordenados.
+"""
+
+import numpy as np
+
+
+class DatosOrdenados:
+    """
+    Secuencia de los datos ordenados que se calcula solo al consultarla.
+
+    Las medidas agrupadas solo necesitan el mínimo, el máximo y los conteos
+    por clase, así que el ordenamiento (O(n log n) y una copia completa) se
+    hace con np.sort la primera vez que se accede a los datos, por ejemplo
+    para mostrarlos en la pestaña de preliminares.
+    """
+
+    def __init__(self, datos, pesos=None):
+        """
+        Inicializa la vista con los datos sin ordenar.
+
+        Args:
+            datos: Arreglo o lista de valores numéricos
+            pesos: Repeticiones enteras de cada valor (opcional); cada valor
+                   aparece tantas veces como indique su peso
+        """
+        self._datos = datos
+        self._pesos = pesos
+        self._ordenados = None
+
+    @property
+    def calculado(self) -> bool:
+        """Indica si el ordenamiento ya se realizó."""
+        return self._ordenados is not None
+
+    @property
+    def arreglo(self) -> np.ndarray:
+        """Arreglo float64 con los datos ordenados (se calcula una sola vez)."""
+        if self._ordenados is None:
+            if self._pesos is None:
+                ordenados = np.array(self._datos, dtype=np.float64)
+            else:
+                ordenados = np.repeat(np.asarray(self._datos, dtype=np.float64), self._pesos)
+            ordenados.sort()
+            self._ordenados = ordenados
+            self._datos = self._pesos = None
+        return self._ordenados
+
+    def posicion(self, valor: float) -> int:
+        """
+        Busca un valor en los datos ordenados con búsqueda binaria (O(log n)).
+
+        Args:
+            valor: Valor buscado
+
+        Returns:
+            Índice (desde 0) del primer dato mayor o igual que valor; es
+            len(self) si todos los datos son menores
+        """
+        return int(np.searchsorted(self.arreglo, valor, side='left'))
+
+    def tolist(self) -> list:
+        """Devuelve los datos ordenados como lista de Python."""
+        return self.arreglo.tolist()
+
+    def __len__(self) -> int:
+        if self._ordenados is not None:
+            return len(self._ordenados)
+        if self._pesos is not None:
+            return int(np.sum(self._pesos))
+        return len(self._datos)
+
+    def __getitem__(self, indice):
+        return self.arreglo[indice]
+
+    def __iter__(self):
+        return iter(self.arreglo.tolist())
+
+    def __str__(self) -> str:
+        return str(self.tolist())
+
+    def __repr__(self) -> str:
+        return f"DatosOrdenados(n={len(self)}, calculado={self.calculado})"
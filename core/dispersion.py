@@ -2,46 +2,61 @@
 Módulo para calcular medidas de dispersión para datos agrupados.
 """
 
+import numpy as np
 import pandas as pd
 import math
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Union
+from .tabla_frecuencias import TablaFrecuencias
 
 
 class Dispersion:
     """Clase para calcular medidas de dispersión."""
     
-    def __init__(self, tabla: pd.DataFrame, media: float):
+    def __init__(self, tabla: Union[TablaFrecuencias, pd.DataFrame], media: float):
         """
         Inicializa la clase con la tabla de distribución de frecuencias y la media.
         
         Args:
-            tabla: DataFrame con la tabla de frecuencias (sin fila de totales)
+            tabla: TablaFrecuencias (o DataFrame con fila de totales)
             media: Media aritmética calculada previamente
         """
-        self.tabla = tabla[tabla['Intervalo'] != 'TOTAL'].copy()
-        self.n = int(tabla[tabla['Intervalo'] == 'TOTAL']['fi (Frec. Absoluta)'].values[0])
+        if isinstance(tabla, pd.DataFrame):
+            tabla = TablaFrecuencias.desde_dataframe(tabla)
+        self.tabla = tabla
+        self.n = tabla.n
         self.media = media
         
-    def calcular_desviacion_media(self) -> Tuple[float, Dict]:
+    def calcular_desviacion_media(self, detallado: bool = True) -> Tuple[float, Dict]:
         """
         Calcula la desviación media para datos agrupados.
         
+        Args:
+            detallado: Si es False solo se calcula el valor, sin tablas ni
+                       fórmulas de pasos (el diccionario se devuelve vacío)
+            
         Returns:
             Tupla con (resultado, diccionario de pasos)
         """
+        desviaciones = self.tabla.xi - self.media
+        absolutas = np.abs(desviaciones)
+        productos = absolutas * self.tabla.fi
+        if not detallado:
+            return float(productos.sum()) / self.n, {}
+        
         pasos = {}
         
         # Crear tabla de cálculos
-        tabla_calculos = self.tabla[['xi (Marca de Clase)', 'fi (Frec. Absoluta)']].copy()
-        tabla_calculos['xi - x̄'] = tabla_calculos['xi (Marca de Clase)'] - self.media
-        tabla_calculos['|xi - x̄|'] = tabla_calculos['xi - x̄'].abs()
-        tabla_calculos['|xi - x̄| × fi'] = tabla_calculos['|xi - x̄|'] * tabla_calculos['fi (Frec. Absoluta)']
-        
-        pasos['tabla'] = tabla_calculos
+        pasos['tabla'] = pd.DataFrame({
+            'xi (Marca de Clase)': self.tabla.xi,
+            'fi (Frec. Absoluta)': self.tabla.fi,
+            'xi - x̄': desviaciones,
+            '|xi - x̄|': absolutas,
+            '|xi - x̄| × fi': productos
+        })
         pasos['media'] = self.media
         
         # Calcular suma
-        suma = tabla_calculos['|xi - x̄| × fi'].sum()
+        suma = float(productos.sum())
         pasos['suma'] = suma
         pasos['formula_suma'] = f"Σ|xi - x̄| × fi = {suma:.4f}"
         
@@ -53,26 +68,37 @@ class Dispersion:
         
         return dm, pasos
     
-    def calcular_desviacion_estandar(self) -> Tuple[float, Dict]:
+    def calcular_desviacion_estandar(self, detallado: bool = True) -> Tuple[float, Dict]:
         """
         Calcula la desviación estándar para datos agrupados.
         
+        Args:
+            detallado: Si es False solo se calcula el valor, sin tablas ni
+                       fórmulas de pasos (el diccionario se devuelve vacío)
+            
         Returns:
             Tupla con (resultado, diccionario de pasos)
         """
+        desviaciones = self.tabla.xi - self.media
+        cuadrados = desviaciones ** 2
+        productos = cuadrados * self.tabla.fi
+        if not detallado:
+            return math.sqrt(float(productos.sum()) / self.n), {}
+        
         pasos = {}
         
         # Crear tabla de cálculos
-        tabla_calculos = self.tabla[['xi (Marca de Clase)', 'fi (Frec. Absoluta)']].copy()
-        tabla_calculos['xi - x̄'] = tabla_calculos['xi (Marca de Clase)'] - self.media
-        tabla_calculos['(xi - x̄)²'] = tabla_calculos['xi - x̄'] ** 2
-        tabla_calculos['(xi - x̄)² × fi'] = tabla_calculos['(xi - x̄)²'] * tabla_calculos['fi (Frec. Absoluta)']
-        
-        pasos['tabla'] = tabla_calculos
+        pasos['tabla'] = pd.DataFrame({
+            'xi (Marca de Clase)': self.tabla.xi,
+            'fi (Frec. Absoluta)': self.tabla.fi,
+            'xi - x̄': desviaciones,
+            '(xi - x̄)²': cuadrados,
+            '(xi - x̄)² × fi': productos
+        })
         pasos['media'] = self.media
         
         # Calcular suma
-        suma = tabla_calculos['(xi - x̄)² × fi'].sum()
+        suma = float(productos.sum())
         pasos['suma'] = suma
         pasos['formula_suma'] = f"Σ(xi - x̄)² × fi = {suma:.4f}"
         
@@ -3,23 +3,107 @@ Módulo para calcular la distribución de frecuencias de datos agrupados.
 """
 
 import math
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from .conteo import (umbrales_intervalos, frecuencias_desde_menores,
+                     admite_conteo_enteros, contar_menores_enteros)
+from .datos_ordenados import DatosOrdenados
+from .momentos import Momentos
+from .paralelo import contar_menores_paralelo
+from .reglas_clases import REGLAS, numero_clases
+from .tabla_frecuencias import TablaFrecuencias
+
+# Función de progreso por fase: recibe el nombre de la fase ('parametros',
+# 'conteo', 'tendencia' o 'dispersion') y la fracción avanzada de esa fase
+ProgresoFases = Callable[[str, float], None]
 
 
 class DistribucionFrecuencia:
     """Clase para calcular la distribución de frecuencias de datos agrupados."""
     
-    def __init__(self, datos: List[float]):
+    def __init__(self, datos: Union[List[float], np.ndarray], procesos: Optional[int] = 1,
+                 regla: str = 'sturges', pesos: Optional[Union[List[int], np.ndarray]] = None,
+                 enteros: Optional[bool] = None, progreso: Optional[ProgresoFases] = None):
         """
         Inicializa la clase con los datos a analizar.
         
         Args:
-            datos: Lista de valores numéricos
+            datos: Lista de valores numéricos o arreglo mapeado en memoria
+                   (ver core.fuentes.abrir_binario)
+            procesos: Número de procesos para el conteo de frecuencias
+                      (1 = serial, None = todos los núcleos)
+            regla: Regla del número de clases ('sturges', 'scott',
+                   'freedman_diaconis', 'rice' o 'raiz')
+            pesos: Frecuencia entera de cada valor, para datos ya resumidos
+                   como pares (valor, repeticiones); n es la suma de los pesos
+            enteros: Si los datos son enteros se cuentan con bincount en lugar
+                     de búsquedas (mismo resultado). None = detectarlo,
+                     True = el llamador lo garantiza, False = no usarlo
+            progreso: Función que recibe el avance de las fases 'parametros'
+                      y 'conteo' (el conteo informa después de cada bloque;
+                      si la función lanza una excepción el cálculo se detiene)
         """
-        self.datos = sorted(datos)
-        self.n = len(datos)
+        if regla not in REGLAS:
+            raise ValueError(f"Regla de número de clases desconocida: '{regla}'.")
+        # Los datos no se ordenan: el ordenamiento se hace solo si se consulta
+        # (ver datos_ordenados). Los arreglos mapeados tampoco se copian.
+        if not isinstance(datos, np.ndarray):
+            datos = np.asarray(datos, dtype=np.float64)
+        if pesos is not None:
+            datos, pesos = self.validar_pesos(datos, pesos)
+        self.datos = datos
+        self.pesos = pesos
+        self.n = len(datos) if pesos is None else int(pesos.sum())
+        self.procesos = procesos
+        self.regla = regla
+        self.enteros = enteros
+        self.progreso = progreso
         self.pasos = {}
+        self.momentos = None
+        self._datos_ordenados = None
+    
+    @property
+    def datos_ordenados(self) -> DatosOrdenados:
+        """Vista de los datos ordenados que se calcula al primer acceso."""
+        if self._datos_ordenados is None:
+            self._datos_ordenados = DatosOrdenados(self.datos, self.pesos)
+        return self._datos_ordenados
+    
+    @staticmethod
+    def validar_pesos(datos: np.ndarray, pesos) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Comprueba que los pesos sean repeticiones enteras no negativas.
+        
+        Los valores con peso cero se descartan, ya que no forman parte de
+        los datos (no cuentan para el mínimo ni el máximo).
+        
+        Args:
+            datos: Arreglo de valores
+            pesos: Repeticiones de cada valor
+            
+        Returns:
+            Tupla con (valores, pesos int64) sin los valores de peso cero
+            
+        Raises:
+            ValueError: Si los pesos no son válidos o no hay datos
+        """
+        pesos = np.asarray(pesos)
+        if pesos.shape != datos.shape:
+            raise ValueError("Los valores y sus frecuencias deben tener la misma longitud.")
+        if pesos.dtype.kind not in 'iu':
+            if pesos.dtype.kind != 'f' or not np.all(np.mod(pesos, 1) == 0):
+                raise ValueError("Las frecuencias deben ser números enteros.")
+        if np.any(pesos < 0):
+            raise ValueError("Las frecuencias no pueden ser negativas.")
+        pesos = pesos.astype(np.int64)
+        
+        presentes = pesos > 0
+        if not presentes.all():
+            datos, pesos = datos[presentes], pesos[presentes]
+        if len(datos) == 0:
+            raise ValueError("No hay datos con frecuencia mayor que cero.")
+        return datos, pesos
         
     def calcular_parametros(self) -> Dict:
         """
@@ -27,34 +111,73 @@ class DistribucionFrecuencia:
         
         Returns:
             Diccionario con los parámetros calculados y los pasos
+            
+        Raises:
+            ValueError: Si algún dato es infinito o NaN
         """
-        # Paso 1: Ordenar datos
-        self.pasos['datos_ordenados'] = self.datos.copy()
+        # Paso 1: Ordenar datos (perezoso: se ordena al primer acceso)
+        self.pasos['datos_ordenados'] = self.datos_ordenados
         
-        # Paso 2: Valor mínimo y máximo
-        x_min = min(self.datos)
-        x_max = max(self.datos)
-        self.pasos['x_min'] = x_min
-        self.pasos['x_max'] = x_max
+        # Paso 2: Valor mínimo y máximo (O(n), sin ordenar)
+        x_min = float(self.datos.min())
+        x_max = float(self.datos.max())
+        
+        return self.parametros_agrupacion(self.n, x_min, x_max, self.pasos,
+                                          self.regla, self.datos, self.pesos)
+    
+    @staticmethod
+    def parametros_agrupacion(n: int, x_min: float, x_max: float, pasos: Dict,
+                              regla: str = 'sturges',
+                              datos: Optional[np.ndarray] = None,
+                              pesos: Optional[np.ndarray] = None) -> Dict:
+        """
+        Calcula rango, número de clases y amplitud a partir de n y los extremos.
+        
+        Con las reglas que solo dependen de n (Sturges, Rice, raíz) no hacen
+        falta los datos, por lo que también la usan los analizadores que no
+        tienen todos los datos en memoria.
+        
+        Args:
+            n: Número de datos
+            x_min: Valor mínimo
+            x_max: Valor máximo
+            pasos: Diccionario donde se registran los pasos
+            regla: Regla del número de clases (ver core.reglas_clases.REGLAS)
+            datos: Valores (solo para las reglas de Scott y Freedman–Diaconis)
+            pesos: Repeticiones de cada valor, si los datos vienen resumidos
+            
+        Returns:
+            Diccionario con los parámetros calculados y los pasos
+            
+        Raises:
+            ValueError: Si algún extremo es infinito o NaN
+        """
+        if not (math.isfinite(x_min) and math.isfinite(x_max)):
+            # Un NaN o un infinito en los datos aparece en el mínimo o en el máximo
+            raise ValueError("Los datos contienen valores no finitos (inf o NaN).")
+        
+        pasos['x_min'] = x_min
+        pasos['x_max'] = x_max
         
         # Paso 3: Calcular rango
         rango = x_max - x_min
-        self.pasos['rango'] = rango
-        self.pasos['rango_formula'] = f"R = Xmax - Xmin = {x_max} - {x_min} = {rango}"
+        pasos['rango'] = rango
+        pasos['rango_formula'] = f"R = Xmax - Xmin = {x_max} - {x_min} = {rango}"
         
-        # Paso 4: Calcular número de clases (Regla de Sturges)
-        k_decimal = 1 + 3.322 * math.log10(self.n)
-        k = math.ceil(k_decimal)
-        self.pasos['k_decimal'] = k_decimal
-        self.pasos['k'] = k
-        self.pasos['k_formula'] = f"k = 1 + 3.322 × log10(n) = 1 + 3.322 × log10({self.n}) = {k_decimal:.4f} ≈ {k}"
+        # Paso 4: Calcular número de clases (Sturges por defecto)
+        k, k_decimal, k_formula = numero_clases(regla, n, rango, datos, pesos)
+        pasos['regla'] = regla
+        pasos['regla_nombre'] = REGLAS[regla][0]
+        pasos['k_decimal'] = k_decimal
+        pasos['k'] = k
+        pasos['k_formula'] = k_formula
         
         # Paso 5: Calcular amplitud
         amplitud_decimal = rango / k
         amplitud = math.ceil(amplitud_decimal)
-        self.pasos['amplitud_decimal'] = amplitud_decimal
-        self.pasos['amplitud'] = amplitud
-        self.pasos['amplitud_formula'] = f"A = R / k = {rango} / {k} = {amplitud_decimal:.4f} ≈ {amplitud}"
+        pasos['amplitud_decimal'] = amplitud_decimal
+        pasos['amplitud'] = amplitud
+        pasos['amplitud_formula'] = f"A = R / k = {rango} / {k} = {amplitud_decimal:.4f} ≈ {amplitud}"
         
         return {
             'x_min': x_min,
@@ -62,10 +185,11 @@ class DistribucionFrecuencia:
             'rango': rango,
             'k': k,
             'amplitud': amplitud,
-            'pasos': self.pasos
+            'pasos': pasos
         }
     
-    def crear_intervalos(self, x_min: float, amplitud: float, k: int) -> List[Tuple[float, float]]:
+    @staticmethod
+    def crear_intervalos(x_min: float, amplitud: float, k: int) -> List[Tuple[float, float]]:
         """
         Crea los intervalos de clase.
         
@@ -84,6 +208,43 @@ class DistribucionFrecuencia:
             intervalos.append((li, ls))
         return intervalos
     
+    def calcular_tabla_frecuencias(self, intervalos: List[Tuple[float, float]]) -> TablaFrecuencias:
+        """
+        Calcula las frecuencias para cada intervalo sobre arreglos numéricos.
+        
+        Args:
+            intervalos: Lista de intervalos de clase
+            
+        Returns:
+            TablaFrecuencias con las columnas Li, Ls, xi, fi, Fi y hi
+        """
+        # Conteo vectorizado: una sola pasada sobre los datos contra los límites
+        # (el último intervalo es cerrado [li, ls], los demás [li, ls)). En la
+        # misma pasada se acumulan los momentos exactos de los datos sin agrupar.
+        umbrales = umbrales_intervalos(intervalos)
+        self.momentos = Momentos()
+        x_min = self.pasos.get('x_min', None)
+        x_max = self.pasos.get('x_max', None)
+        if x_min is None:
+            x_min, x_max = float(self.datos.min()), float(self.datos.max())
+        
+        avance = None
+        if self.progreso is not None:
+            avance = lambda fraccion: self.progreso('conteo', fraccion)
+        
+        if self.enteros is not False and admite_conteo_enteros(
+                self.datos, x_min, x_max, verificar=not self.enteros):
+            # Datos enteros: conteo directo por valor y plegado en las clases
+            menores = contar_menores_enteros(self.datos, umbrales, x_min, x_max,
+                                             self.pesos, self.momentos, avance)
+        else:
+            menores = contar_menores_paralelo(self.datos, umbrales, self.procesos,
+                                              self.momentos, self.pesos, avance)
+        frecuencias = frecuencias_desde_menores(menores)
+        
+        limites = np.asarray(intervalos, dtype=np.float64).reshape(-1, 2)
+        return TablaFrecuencias(limites[:, 0], limites[:, 1], frecuencias, self.n)
+    
     def calcular_frecuencias(self, intervalos: List[Tuple[float, float]]) -> pd.DataFrame:
         """
         Calcula las frecuencias para cada intervalo.
@@ -94,74 +255,36 @@ class DistribucionFrecuencia:
         Returns:
             DataFrame con la tabla de distribución de frecuencias
         """
-        # Preparar datos para la tabla
-        tabla_data = []
-        frecuencia_acumulada = 0
-        
-        for i, (li, ls) in enumerate(intervalos):
-            # Marca de clase
-            xi = (li + ls) / 2
-            
-            # Frecuencia absoluta (conteo de datos en el intervalo)
-            if i == len(intervalos) - 1:
-                # Último intervalo es cerrado [li, ls]
-                fi = sum(1 for x in self.datos if li <= x <= ls)
-            else:
-                # Intervalo cerrado-abierto [li, ls)
-                fi = sum(1 for x in self.datos if li <= x < ls)
-            
-            # Frecuencia acumulada
-            frecuencia_acumulada += fi
-            Fi = frecuencia_acumulada
-            
-            # Frecuencia relativa
-            hi = fi / self.n
-            
-            # Frecuencia relativa porcentual
-            hi_porcentaje = hi * 100
-            
-            tabla_data.append({
-                'Intervalo': f"[{li:.2f} - {ls:.2f})",
-                'Li': li,
-                'Ls': ls,
-                'xi (Marca de Clase)': xi,
-                'fi (Frec. Absoluta)': fi,
-                'Fi (Frec. Acumulada)': Fi,
-                'hi (Frec. Relativa)': hi,
-                'hi% (Frec. Relativa %)': hi_porcentaje
-            })
-        
-        # Crear DataFrame
-        df = pd.DataFrame(tabla_data)
-        
-        # Agregar fila de totales
-        totales = {
-            'Intervalo': 'TOTAL',
-            'Li': '',
-            'Ls': '',
-            'xi (Marca de Clase)': '',
-            'fi (Frec. Absoluta)': self.n,
-            'Fi (Frec. Acumulada)': '',
-            'hi (Frec. Relativa)': 1.00,
-            'hi% (Frec. Relativa %)': 100.00
-        }
-        df = pd.concat([df, pd.DataFrame([totales])], ignore_index=True)
-        
-        return df
+        return self.calcular_tabla_frecuencias(intervalos).a_dataframe()
     
-    def generar_tabla(self) -> Tuple[pd.DataFrame, Dict]:
+    def generar_tabla_frecuencias(self) -> Tuple[TablaFrecuencias, Dict]:
         """
-        Genera la tabla completa de distribución de frecuencias.
+        Genera la tabla de distribución de frecuencias como arreglos numéricos.
         
         Returns:
-            Tupla con (DataFrame de la tabla, diccionario de parámetros)
+            Tupla con (TablaFrecuencias, diccionario de parámetros)
         """
+        if self.progreso is not None:
+            self.progreso('parametros', 0.0)
         parametros = self.calcular_parametros()
         intervalos = self.crear_intervalos(
             parametros['x_min'],
             parametros['amplitud'],
             parametros['k']
         )
-        tabla = self.calcular_frecuencias(intervalos)
+        if self.progreso is not None:
+            self.progreso('parametros', 1.0)
+        tabla = self.calcular_tabla_frecuencias(intervalos)
         
         return tabla, parametros
+    
+    def generar_tabla(self) -> Tuple[pd.DataFrame, Dict]:
+        """
+        Genera la tabla completa de distribución de frecuencias.
+        
+        Returns:
+            Tupla con (DataFrame de la tabla, diccionario de parámetros)
+        """
+        tabla, parametros = self.generar_tabla_frecuencias()
+        
+        return tabla.a_dataframe(), parametros
@@ -2,25 +2,105 @@
 Módulo principal para el análisis estadístico completo.
 """
 
-from typing import Dict, List
-from .distribucion_frecuencia import DistribucionFrecuencia
+from typing import Dict, List, Optional, Tuple
+from .distribucion_frecuencia import DistribucionFrecuencia, ProgresoFases
+from .tabla_frecuencias import TablaFrecuencias
 from .tendencia_central import TendenciaCentral
 from .dispersion import Dispersion
+from .fuentes import abrir_binario, leer_valores_frecuencias
+from .cache import CacheResultados
+from .datos_ordenados import DatosOrdenados
+
+# Fases del cálculo en el orden en que se informan a la función de progreso
+FASES = ('parametros', 'conteo', 'tendencia', 'dispersion')
+
+
+class CalculoCancelado(Exception):
+    """Excepción que lanza la función de progreso para detener un cálculo."""
 
 
 class AnalizadorEstadistico:
     """Clase principal que coordina todos los cálculos estadísticos."""
     
-    def __init__(self, datos: List[float]):
+    def __init__(self, datos: List[float], procesos: Optional[int] = 1,
+                 detallado: bool = True, cache: Optional[CacheResultados] = None,
+                 regla: str = 'sturges', pesos: Optional[List[int]] = None,
+                 enteros: Optional[bool] = None,
+                 progreso: Optional[ProgresoFases] = None):
         """
         Inicializa el analizador con los datos a procesar.
         
         Args:
-            datos: Lista de valores numéricos
+            datos: Lista de valores numéricos o arreglo mapeado en memoria
+            procesos: Número de procesos para el conteo de frecuencias
+                      (1 = serial, None = todos los núcleos). El resultado
+                      es idéntico al del cálculo serial.
+            detallado: Si es False, calcular_todo solo obtiene los valores
+                       numéricos y las frecuencias; las tablas y fórmulas de
+                       los pasos se construyen al llamar a obtener_paso_a_paso
+            cache: Caché de resultados; si los mismos datos ya se analizaron
+                   con los mismos parámetros se devuelven sin recalcular
+            regla: Regla del número de clases ('sturges', 'scott',
+                   'freedman_diaconis', 'rice' o 'raiz')
+            pesos: Frecuencia de cada valor cuando los datos vienen como pares
+                   (valor, repeticiones), en un arreglo paralelo a datos
+            enteros: Conteo rápido para datos enteros (None = detectarlo,
+                     True = garantizado por el llamador, False = desactivado)
+            progreso: Función que recibe (fase, fracción) durante calcular_todo
+                      para cada una de FASES; si lanza CalculoCancelado (u
+                      otra excepción) el cálculo se detiene en ese punto
         """
         self.datos = datos
+        self.pesos = pesos
+        self.enteros = enteros
+        self.procesos = procesos
+        self.regla = regla
+        self.detallado = detallado
+        self.cache = cache
+        self.progreso = progreso
+        self.momentos = None
+        self.resumen = None
         self.resultados = {}
         
+    @classmethod
+    def desde_binario(cls, ruta: str, tipo: Optional[str] = None,
+                      procesos: Optional[int] = 1,
+                      detallado: bool = True,
+                      regla: str = 'sturges') -> 'AnalizadorEstadistico':
+        """
+        Crea un analizador sobre un archivo .npy o binario crudo mapeado en memoria.
+        
+        Args:
+            ruta: Ruta del archivo
+            tipo: 'float64' o 'float32' para archivos crudos little-endian
+            procesos: Número de procesos para el conteo de frecuencias
+            detallado: Si es False solo se calculan los valores numéricos
+            regla: Regla del número de clases
+            
+        Returns:
+            Instancia de AnalizadorEstadistico
+        """
+        return cls(abrir_binario(ruta, tipo), procesos, detallado, regla=regla)
+    
+    @classmethod
+    def desde_frecuencias(cls, ruta: str, procesos: Optional[int] = 1,
+                          detallado: bool = True,
+                          regla: str = 'sturges') -> 'AnalizadorEstadistico':
+        """
+        Crea un analizador a partir de un archivo de dos columnas (valor, frecuencia).
+        
+        Args:
+            ruta: Ruta del archivo de texto
+            procesos: Número de procesos para el conteo de frecuencias
+            detallado: Si es False solo se calculan los valores numéricos
+            regla: Regla del número de clases
+            
+        Returns:
+            Instancia de AnalizadorEstadistico
+        """
+        valores, pesos = leer_valores_frecuencias(ruta)
+        return cls(valores, procesos, detallado, regla=regla, pesos=pesos)
+        
     def calcular_todo(self) -> Dict:
         """
         Realiza todos los cálculos estadísticos.
@@ -28,40 +108,120 @@ class AnalizadorEstadistico:
         Returns:
             Diccionario con todos los resultados y pasos
         """
+        clave = None
+        if self.cache is not None and self.datos is not None:
+            clave = self.cache.clave(self.datos, self.pesos, **self._parametros_cache())
+            guardados = self.cache.obtener(clave)
+            if guardados is not None:
+                # La vista de los datos ordenados no se guarda: se reconstruye
+                # (perezosa) sobre los datos del llamador
+                pasos = guardados['distribucion']['parametros']['pasos']
+                pasos['datos_ordenados'] = DatosOrdenados(self.datos, self.pesos)
+                self.resultados = guardados
+                return self.resultados
+        
         # 1. Distribución de frecuencias
-        dist_freq = DistribucionFrecuencia(self.datos)
-        tabla, parametros = dist_freq.generar_tabla()
+        tabla, parametros = self._generar_distribucion()
         
         self.resultados['distribucion'] = {
-            'tabla': tabla,
+            'tabla': tabla.a_dataframe() if self.detallado else None,
+            'tabla_frecuencias': tabla,
             'parametros': parametros
         }
         
-        # 2. Tendencia central
+        # Momentos exactos (sin agrupar), obtenidos en la misma pasada del conteo
+        if self.momentos is not None:
+            self.resultados['momentos'] = self.momentos.a_diccionario()
+        
+        # Cuantiles aproximados (solo si el analizador mantiene un resumen KLL)
+        if self.resumen is not None:
+            self.resultados['cuantiles_aproximados'] = self.resumen.a_diccionario()
+        
+        # 2 y 3. Tendencia central y dispersión
+        self._calcular_medidas(tabla, self.detallado)
+        
+        if clave is not None:
+            self.cache.guardar(clave, self._resultados_para_cache())
+        
+        return self.resultados
+    
+    def _resultados_para_cache(self) -> Dict:
+        """
+        Copia de los resultados sin la vista de los datos ordenados.
+        
+        Esa vista contiene todos los datos (y al serializarla se leería un
+        arreglo mapeado completo); guardarla copiaría el conjunto de datos en
+        cada entrada de la caché.
+        """
+        distribucion = dict(self.resultados['distribucion'])
+        parametros = dict(distribucion['parametros'])
+        pasos = dict(parametros['pasos'])
+        pasos.pop('datos_ordenados', None)
+        parametros['pasos'] = pasos
+        distribucion['parametros'] = parametros
+        return {**self.resultados, 'distribucion': distribucion}
+    
+    def _parametros_cache(self) -> Dict:
+        """Parámetros que, junto con los datos, determinan los resultados."""
+        return {'regla': self.regla, 'detallado': self.detallado}
+    
+    def _generar_distribucion(self) -> Tuple[TablaFrecuencias, Dict]:
+        """
+        Genera la tabla de frecuencias a partir de los datos.
+        
+        Returns:
+            Tupla con (TablaFrecuencias, diccionario de parámetros)
+        """
+        dist_freq = DistribucionFrecuencia(self.datos, self.procesos, self.regla, self.pesos,
+                                           self.enteros, self.progreso)
+        tabla, parametros = dist_freq.generar_tabla_frecuencias()
+        self.momentos = dist_freq.momentos
+        return tabla, parametros
+    
+    def _calcular_medidas(self, tabla: TablaFrecuencias, detallado: bool = True):
+        """
+        Calcula las medidas de tendencia central y de dispersión.
+        
+        Args:
+            tabla: Tabla de frecuencias ya generada
+            detallado: Si es False los pasos quedan en None (solo valores)
+        """
+        # Tendencia central
+        self._avanzar('tendencia', 0.0)
         tend_central = TendenciaCentral(tabla)
         
-        media, pasos_media = tend_central.calcular_media()
-        mediana, pasos_mediana = tend_central.calcular_mediana()
-        moda, pasos_moda = tend_central.calcular_moda()
+        media, pasos_media = tend_central.calcular_media(detallado)
+        mediana, pasos_mediana = tend_central.calcular_mediana(detallado)
+        moda, pasos_moda = tend_central.calcular_moda(detallado)
+        if not detallado:
+            pasos_media = pasos_mediana = pasos_moda = None
         
         self.resultados['tendencia_central'] = {
             'media': {'valor': media, 'pasos': pasos_media},
             'mediana': {'valor': mediana, 'pasos': pasos_mediana},
             'moda': {'valor': moda, 'pasos': pasos_moda}
         }
+        self._avanzar('tendencia', 1.0)
         
-        # 3. Dispersión
+        # Dispersión
+        self._avanzar('dispersion', 0.0)
         dispersion = Dispersion(tabla, media)
         
-        dm, pasos_dm = dispersion.calcular_desviacion_media()
-        de, pasos_de = dispersion.calcular_desviacion_estandar()
+        dm, pasos_dm = dispersion.calcular_desviacion_media(detallado)
+        de, pasos_de = dispersion.calcular_desviacion_estandar(detallado)
+        if not detallado:
+            pasos_dm = pasos_de = None
         
         self.resultados['dispersion'] = {
             'desviacion_media': {'valor': dm, 'pasos': pasos_dm},
             'desviacion_estandar': {'valor': de, 'pasos': pasos_de}
         }
-        
-        return self.resultados
+        self._avanzar('dispersion', 1.0)
+    
+    def _avanzar(self, fase: str, fraccion: float):
+        """Informa el avance de una fase a la función de progreso, si hay una."""
+        if self.progreso is not None:
+            self.progreso(fase, fraccion)
     
     def obtener_paso_a_paso(self) -> Dict:
         """
@@ -72,10 +232,12 @@ class AnalizadorEstadistico:
         """
         if not self.resultados:
             self.calcular_todo()
+        self._completar_pasos()
         
         return {
             'preliminares': self.resultados['distribucion']['parametros']['pasos'],
             'tabla': self.resultados['distribucion']['tabla'],
+            'tabla_frecuencias': self.resultados['distribucion']['tabla_frecuencias'],
             'tendencia_central': {
                 'media': self.resultados['tendencia_central']['media']['pasos'],
                 'mediana': self.resultados['tendencia_central']['mediana']['pasos'],
@@ -86,3 +248,36 @@ class AnalizadorEstadistico:
                 'desviacion_estandar': self.resultados['dispersion']['desviacion_estandar']['pasos']
             }
         }
+    
+    def _completar_pasos(self):
+        """Construye las tablas y fórmulas de los pasos si se omitieron."""
+        distribucion = self.resultados['distribucion']
+        if distribucion['tabla'] is None:
+            distribucion['tabla'] = distribucion['tabla_frecuencias'].a_dataframe()
+        if self.resultados['tendencia_central']['media']['pasos'] is None:
+            self._calcular_medidas(distribucion['tabla_frecuencias'])
+    
+    def obtener_valores(self) -> Dict:
+        """
+        Obtiene solo los resultados numéricos y las frecuencias absolutas.
+        
+        Returns:
+            Diccionario plano con n, k, amplitud, las medidas y fi
+        """
+        if not self.resultados:
+            self.calcular_todo()
+        
+        parametros = self.resultados['distribucion']['parametros']
+        tc = self.resultados['tendencia_central']
+        disp = self.resultados['dispersion']
+        return {
+            'n': self.resultados['distribucion']['tabla_frecuencias'].n,
+            'k': parametros['k'],
+            'amplitud': parametros['amplitud'],
+            'media': tc['media']['valor'],
+            'mediana': tc['mediana']['valor'],
+            'moda': tc['moda']['valor'],
+            'desviacion_media': disp['desviacion_media']['valor'],
+            'desviacion_estandar': disp['desviacion_estandar']['valor'],
+            'fi': self.resultados['distribucion']['tabla_frecuencias'].fi
+        }
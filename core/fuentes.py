@@ -0,0 +1,95 @@
+"""
+Módulo para abrir conjuntos de datos binarios mapeados en memoria y
+archivos de valores con su frecuencia.
+"""
+
+import os
+import re
+import numpy as np
+from typing import Optional, Tuple
+
+# Tipos admitidos para archivos binarios sin encabezado (little-endian)
+TIPOS_BINARIOS = {
+    'float64': '<f8',
+    'float32': '<f4'
+}
+
+# Separadores de columnas en archivos de texto (coma, punto y coma, espacios)
+SEPARADORES_COLUMNAS = re.compile(r'[,;\s]+')
+
+
+def abrir_binario(ruta: str, tipo: Optional[str] = None) -> np.memmap:
+    """
+    Abre un archivo .npy o binario sin encabezado como arreglo mapeado en memoria.
+
+    Los datos no se leen ni se convierten a objetos de Python: el sistema
+    operativo carga las páginas del archivo a medida que se recorren.
+
+    Args:
+        ruta: Ruta del archivo (.npy o binario crudo)
+        tipo: 'float64' o 'float32' para archivos crudos (por defecto 'float64');
+              en archivos .npy se usa el tipo guardado en el encabezado
+
+    Returns:
+        Arreglo de una dimensión de solo lectura mapeado en memoria
+
+    Raises:
+        ValueError: Si el archivo no contiene un arreglo numérico de una dimensión
+    """
+    if os.path.splitext(ruta)[1].lower() == '.npy':
+        datos = np.load(ruta, mmap_mode='r')
+        if datos.dtype.kind not in 'iuf':
+            raise ValueError(f"El archivo '{ruta}' no contiene datos numéricos.")
+    else:
+        tipo = tipo or 'float64'
+        if tipo not in TIPOS_BINARIOS:
+            raise ValueError(f"Tipo binario no admitido: '{tipo}'. Use 'float64' o 'float32'.")
+        datos = np.memmap(ruta, dtype=TIPOS_BINARIOS[tipo], mode='r')
+
+    if datos.ndim != 1:
+        raise ValueError(f"El archivo '{ruta}' debe contener un arreglo de una dimensión.")
+    return datos
+
+
+def leer_valores_frecuencias(ruta: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Lee un archivo de texto con dos columnas: valor y frecuencia.
+
+    Las columnas pueden separarse con comas, punto y coma, tabuladores o
+    espacios. Se ignoran las líneas vacías, las que empiezan con '#' y una
+    primera línea de encabezado no numérica.
+
+    Args:
+        ruta: Ruta del archivo
+
+    Returns:
+        Tupla con (valores float64, frecuencias int64)
+
+    Raises:
+        ValueError: Si alguna línea no tiene exactamente dos números o una
+                    frecuencia no es entera
+    """
+    valores = []
+    frecuencias = []
+    with open(ruta, 'r', encoding='utf-8') as archivo:
+        for numero, linea in enumerate(archivo, start=1):
+            linea = linea.strip()
+            if not linea or linea.startswith('#'):
+                continue
+            columnas = [c for c in SEPARADORES_COLUMNAS.split(linea) if c]
+            if len(columnas) != 2:
+                raise ValueError(f"Línea {numero}: se esperaban dos columnas (valor y frecuencia).")
+            try:
+                valor, frecuencia = float(columnas[0]), float(columnas[1])
+            except ValueError:
+                if numero == 1:
+                    continue
+                raise ValueError(f"Línea {numero}: '{linea}' no contiene dos números.")
+            if not frecuencia.is_integer():
+                raise ValueError(f"Línea {numero}: la frecuencia '{columnas[1]}' no es entera.")
+            valores.append(valor)
+            frecuencias.append(int(frecuencia))
+
+    if not valores:
+        raise ValueError(f"El archivo '{ruta}' no contiene datos.")
+    return np.array(valores, dtype=np.float64), np.array(frecuencias, dtype=np.int64)
@@ -0,0 +1,329 @@
+"""
+Módulo para importar una columna numérica desde archivos CSV, Excel o Parquet.
+"""
+
+import csv
+import os
+import zipfile
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Extensiones admitidas y el formato que les corresponde
+FORMATOS = {
+    '.csv': 'csv',
+    '.txt': 'csv',
+    '.xlsx': 'excel',
+    '.xlsm': 'excel',
+    '.parquet': 'parquet'
+}
+
+# Filtro para los diálogos de selección de archivos
+FILTRO_ARCHIVOS = (
+    "Datos (*.csv *.txt *.xlsx *.xlsm *.parquet);;"
+    "CSV (*.csv *.txt);;Excel (*.xlsx *.xlsm);;Parquet (*.parquet)"
+)
+
+# Separadores que se reconocen en la primera línea de un CSV, en orden de
+# preferencia (Excel en configuración regional española exporta con ';')
+SEPARADORES_CSV = (';', '\t', ',')
+
+# Filas que se convierten por bloque
+FILAS_POR_BLOQUE = 100000
+
+# Función de progreso: recibe (filas leídas, fracción avanzada entre 0 y 1)
+Progreso = Callable[[int, float], None]
+
+
+class AcumuladorNumerico:
+    """
+    Arreglo float64 que crece por bloques sin listas intermedias de Python.
+
+    La capacidad se duplica al llenarse, de modo que agregar n valores cuesta
+    O(n) en total y el resultado final es un único arreglo contiguo.
+    """
+
+    def __init__(self, capacidad: int = FILAS_POR_BLOQUE):
+        self._datos = np.empty(max(1, capacidad), dtype=np.float64)
+        self.n = 0
+
+    def agregar(self, bloque: np.ndarray):
+        """Agrega un bloque de valores al final."""
+        necesario = self.n + len(bloque)
+        if necesario > len(self._datos):
+            nuevo = np.empty(max(necesario, 2 * len(self._datos)), dtype=np.float64)
+            nuevo[:self.n] = self._datos[:self.n]
+            self._datos = nuevo
+        self._datos[self.n:necesario] = bloque
+        self.n = necesario
+
+    def arreglo(self) -> np.ndarray:
+        """Devuelve los valores acumulados en un arreglo contiguo del tamaño justo."""
+        if self.n == len(self._datos):
+            return self._datos
+        return self._datos[:self.n].copy()
+
+
+def formato_archivo(ruta: str) -> str:
+    """
+    Obtiene el formato de un archivo a partir de su extensión.
+
+    Args:
+        ruta: Ruta del archivo
+
+    Returns:
+        'csv', 'excel' o 'parquet'
+
+    Raises:
+        ValueError: Si la extensión no está admitida
+    """
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension not in FORMATOS:
+        raise ValueError(f"Formato de archivo no admitido: '{extension}'.")
+    return FORMATOS[extension]
+
+
+def detectar_separador(ruta: str) -> str:
+    """
+    Detecta el separador de columnas de un CSV a partir de su primera línea.
+
+    Args:
+        ruta: Ruta del archivo
+
+    Returns:
+        El primer separador de SEPARADORES_CSV que aparece en la primera
+        línea, o ',' si no aparece ninguno (una sola columna)
+    """
+    with open(ruta, 'r', encoding='utf-8-sig', newline='') as archivo:
+        primera = archivo.readline()
+    for separador in SEPARADORES_CSV:
+        if separador in primera:
+            return separador
+    return ','
+
+
+def _decimal_csv(separador: str) -> str:
+    """Separador decimal de un CSV: la coma cuando las columnas van con ';'."""
+    return ',' if separador == ';' else '.'
+
+
+def _es_texto(campo: str, decimal: str = '.') -> bool:
+    """Indica si una celda tiene texto no numérico (las vacías son datos faltantes)."""
+    campo = campo.strip()
+    if not campo:
+        return False
+    try:
+        float(campo.replace(decimal, '.') if decimal != '.' else campo)
+    except ValueError:
+        return True
+    return False
+
+
+def _csv_tiene_encabezado(ruta: str, separador: str, indice: Optional[int] = None) -> bool:
+    """
+    Indica si la primera fila del CSV es un encabezado.
+
+    La fila se lee con el módulo csv (sin la marca BOM y sin las comillas de
+    los campos), de modo que "1.5" y las celdas vacías cuentan como datos.
+
+    Args:
+        ruta: Ruta del archivo
+        separador: Separador de columnas
+        indice: Columna que se revisa (por defecto cualquiera con texto)
+    """
+    with open(ruta, 'r', encoding='utf-8-sig', newline='') as archivo:
+        primera = next(csv.reader(archivo, delimiter=separador), [])
+    if indice is not None:
+        primera = primera[indice:indice + 1]
+    return any(_es_texto(campo, _decimal_csv(separador)) for campo in primera)
+
+
+def _excel_tiene_encabezado(primera: tuple) -> bool:
+    """Indica si la primera fila de la hoja contiene texto no numérico."""
+    for celda in primera:
+        if isinstance(celda, str):
+            try:
+                float(celda)
+            except ValueError:
+                return True
+    return False
+
+
+def _abrir_excel(ruta: str):
+    """
+    Abre un libro de Excel en modo de solo lectura (requiere openpyxl).
+
+    Raises:
+        ValueError: Si el archivo no es un libro de Excel válido
+    """
+    try:
+        import openpyxl
+        from openpyxl.utils.exceptions import InvalidFileException
+    except ImportError:
+        raise ImportError("Se necesita el paquete 'openpyxl' para leer archivos de Excel.")
+    try:
+        return openpyxl.load_workbook(ruta, read_only=True, data_only=True)
+    except (InvalidFileException, zipfile.BadZipFile, KeyError) as e:
+        raise ValueError(f"El archivo '{os.path.basename(ruta)}' no es un libro de Excel válido: {e}")
+
+
+def _primera_fila_excel(libro) -> tuple:
+    """Valores de la primera fila de la hoja activa."""
+    return next(libro.active.iter_rows(max_row=1, values_only=True), ())
+
+
+def _abrir_parquet(ruta: str):
+    """Abre un archivo Parquet (requiere pyarrow)."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Se necesita el paquete 'pyarrow' para leer archivos Parquet.")
+    return pq.ParquetFile(ruta)
+
+
+def columnas_archivo(ruta: str, separador: Optional[str] = None) -> List[str]:
+    """
+    Lee solo el encabezado de un archivo y devuelve los nombres de sus columnas.
+
+    Args:
+        ruta: Ruta del archivo
+        separador: Separador de columnas de los CSV (por defecto se detecta)
+
+    Returns:
+        Lista con los nombres de las columnas ('Columna 1', ... si no hay
+        encabezado)
+    """
+    formato = formato_archivo(ruta)
+    if formato == 'csv':
+        separador = separador or detectar_separador(ruta)
+        encabezado = _csv_tiene_encabezado(ruta, separador)
+        muestra = pd.read_csv(ruta, sep=separador, nrows=1, encoding='utf-8-sig',
+                              header=0 if encabezado else None)
+        if encabezado:
+            return [str(c) for c in muestra.columns]
+        return [f"Columna {i + 1}" for i in range(muestra.shape[1])]
+
+    if formato == 'excel':
+        libro = _abrir_excel(ruta)
+        try:
+            primera = _primera_fila_excel(libro)
+        finally:
+            libro.close()
+        if _excel_tiene_encabezado(primera):
+            return [str(c) if c is not None else f"Columna {i + 1}" for i, c in enumerate(primera)]
+        return [f"Columna {i + 1}" for i in range(len(primera))]
+
+    return list(_abrir_parquet(ruta).schema_arrow.names)
+
+
+def importar_columna(ruta: str, columna: Optional[str] = None, separador: Optional[str] = None,
+                     progreso: Optional[Progreso] = None,
+                     filas_por_bloque: int = FILAS_POR_BLOQUE) -> Tuple[np.ndarray, Dict]:
+    """
+    Importa una columna numérica por bloques en un arreglo float64 contiguo.
+
+    El archivo nunca se carga completo: cada bloque de filas se convierte a
+    números (las celdas vacías o no numéricas se descartan y se cuentan) y
+    se agrega al arreglo final.
+
+    Args:
+        ruta: Ruta del archivo CSV, Excel (.xlsx) o Parquet
+        columna: Nombre de la columna (por defecto la primera)
+        separador: Separador de columnas de los CSV (por defecto se detecta;
+                   con ';' la coma es el separador decimal)
+        progreso: Función que se llama después de cada bloque con las filas
+                  leídas y la fracción avanzada
+        filas_por_bloque: Filas que se convierten por bloque
+
+    Returns:
+        Tupla con (arreglo de valores, diccionario con filas_leidas,
+        filas_validas y filas_descartadas)
+    """
+    formato = formato_archivo(ruta)
+    if formato == 'csv':
+        separador = separador or detectar_separador(ruta)
+    columnas = columnas_archivo(ruta, separador)
+    if columna is None:
+        columna = columnas[0]
+    if columna not in columnas:
+        raise ValueError(f"El archivo no tiene la columna '{columna}'.")
+    indice = columnas.index(columna)
+
+    if formato == 'csv':
+        bloques = _bloques_csv(ruta, indice, separador, filas_por_bloque)
+    elif formato == 'excel':
+        bloques = _bloques_excel(ruta, indice, filas_por_bloque)
+    else:
+        bloques = _bloques_parquet(ruta, columna, filas_por_bloque)
+
+    acumulador = AcumuladorNumerico(filas_por_bloque)
+    filas_leidas = 0
+    for valores, fraccion in bloques:
+        filas_leidas += len(valores)
+        if not (isinstance(valores, np.ndarray) and valores.dtype.kind in 'iuf'):
+            valores = pd.to_numeric(pd.Series(valores), errors='coerce')
+        numeros = np.asarray(valores, dtype=np.float64)
+        acumulador.agregar(numeros[np.isfinite(numeros)])
+        if progreso is not None:
+            progreso(filas_leidas, fraccion)
+
+    datos = acumulador.arreglo()
+    return datos, {
+        'filas_leidas': filas_leidas,
+        'filas_validas': len(datos),
+        'filas_descartadas': filas_leidas - len(datos)
+    }
+
+
+def _bloques_csv(ruta: str, indice: int, separador: str, filas_por_bloque: int):
+    """Genera los bloques de una columna de un CSV con su fracción avanzada."""
+    tamano = max(1, os.path.getsize(ruta))
+    # Solo se omite la primera fila si la columna elegida tiene texto en ella
+    encabezado = _csv_tiene_encabezado(ruta, separador, indice)
+    decimal = _decimal_csv(separador)
+    with open(ruta, 'rb') as archivo:
+        lector = pd.read_csv(archivo, sep=separador, usecols=[indice], encoding='utf-8-sig',
+                             decimal=decimal, header=0 if encabezado else None,
+                             chunksize=filas_por_bloque)
+        for bloque in lector:
+            valores = bloque.iloc[:, 0].to_numpy()
+            if decimal != '.' and valores.dtype == object:
+                # Columna con celdas que pandas no convirtió: se pasan a texto
+                # con punto decimal y se convierten en importar_columna
+                valores = (pd.Series(valores).astype(str)
+                           .str.replace(decimal, '.', regex=False).to_numpy())
+            yield valores, min(1.0, archivo.tell() / tamano)
+
+
+def _bloques_excel(ruta: str, indice: int, filas_por_bloque: int):
+    """Genera los bloques de una columna de la primera hoja de un libro de Excel."""
+    libro = _abrir_excel(ruta)
+    try:
+        hoja = libro.active
+        # Igual que en los CSV, la primera fila es encabezado solo si tiene texto
+        primera_fila = 2 if _excel_tiene_encabezado(_primera_fila_excel(libro)) else 1
+        total = max(1, (hoja.max_row or 1) - primera_fila + 1)
+        leidas = 0
+        valores = []
+        for fila in hoja.iter_rows(min_row=primera_fila, min_col=indice + 1,
+                                   max_col=indice + 1, values_only=True):
+            valores.append(fila[0])
+            if len(valores) >= filas_por_bloque:
+                leidas += len(valores)
+                yield valores, min(1.0, leidas / total)
+                valores = []
+        if valores:
+            yield valores, 1.0
+    finally:
+        libro.close()
+
+
+def _bloques_parquet(ruta: str, columna: str, filas_por_bloque: int):
+    """Genera los bloques de una columna de un archivo Parquet."""
+    archivo = _abrir_parquet(ruta)
+    total = max(1, archivo.metadata.num_rows)
+    leidas = 0
+    for lote in archivo.iter_batches(batch_size=filas_por_bloque, columns=[columna]):
+        valores = lote.column(0).to_numpy(zero_copy_only=False)
+        leidas += len(valores)
+        yield valores, min(1.0, leidas / total)
@@ -0,0 +1,193 @@
+"""
+Módulo para el análisis incremental cuando se agregan o eliminan datos.
+"""
+
+import numpy as np
+from collections import Counter
+from typing import Dict, List, Tuple
+from .conteo import umbrales_intervalos, contar_menores, frecuencias_desde_menores
+from .distribucion_frecuencia import DistribucionFrecuencia
+from .estadistica import AnalizadorEstadistico
+from .tabla_frecuencias import TablaFrecuencias
+
+
+class AnalizadorIncremental(AnalizadorEstadistico):
+    """
+    Analizador que actualiza la tabla al agregar o eliminar valores.
+
+    Conserva los conteos por clase y solo vuelve a agrupar todos los datos
+    cuando cambia x_min, x_max o el número de clases de Sturges; en los demás
+    casos cada lote cuesta O(tamaño del lote + k).
+    """
+
+    def __init__(self, datos: List[float] = (), detallado: bool = True):
+        """
+        Inicializa el analizador, opcionalmente con datos iniciales.
+
+        Args:
+            datos: Valores numéricos iniciales
+            detallado: Si es False cada actualización solo calcula los valores
+                       numéricos (ver AnalizadorEstadistico)
+        """
+        super().__init__(None, detallado=detallado)
+        self.valores = Counter()   # valor -> repeticiones
+        self.n = 0
+        self.parametros = None
+        self.umbrales = None
+        self.menores = None
+        if len(datos):
+            self.agregar(datos)
+
+    def agregar(self, valores: List[float]) -> Dict:
+        """
+        Agrega valores y actualiza los resultados.
+
+        Args:
+            valores: Valores numéricos a agregar
+
+        Returns:
+            Diccionario con todos los resultados y pasos (como calcular_todo)
+
+        Raises:
+            ValueError: Si algún valor es infinito o NaN
+        """
+        return self.reemplazar((), valores)
+
+    def eliminar(self, valores: List[float]) -> Dict:
+        """
+        Elimina valores previamente agregados y actualiza los resultados.
+
+        Args:
+            valores: Valores numéricos a eliminar
+
+        Returns:
+            Diccionario con todos los resultados y pasos (como calcular_todo)
+
+        Raises:
+            ValueError: Si algún valor no está en los datos
+        """
+        return self.reemplazar(valores, ())
+
+    def reemplazar(self, eliminados: List[float], agregados: List[float]) -> Dict:
+        """
+        Elimina y agrega valores en una sola actualización.
+
+        Los parámetros (k y amplitud) se comparan una sola vez, con el n final,
+        de modo que expirar un valor y agregar otro en una ventana llena no
+        provoca dos reagrupaciones cuando k difiere entre N - 1 y N.
+
+        Args:
+            eliminados: Valores a eliminar (deben estar en los datos)
+            agregados: Valores a agregar
+
+        Returns:
+            Diccionario con todos los resultados y pasos (como calcular_todo)
+
+        Raises:
+            ValueError: Si algún valor eliminado no está en los datos o algún
+                        valor agregado es infinito o NaN (los datos no cambian)
+        """
+        self._reemplazar_lote(eliminados, agregados)
+        return self._actualizar_resultados()
+
+    def _actualizar_resultados(self) -> Dict:
+        """Recalcula las medidas a partir de los conteos actuales (O(k))."""
+        # Un diccionario nuevo en cada actualización: los resultados devueltos
+        # antes no cambian al seguir agregando o eliminando valores
+        self.resultados = {}
+        if self.n == 0:
+            return self.resultados
+        return self.calcular_todo()
+
+    def _reemplazar_lote(self, eliminados: List[float], agregados: List[float]):
+        """Actualiza los conteos con un lote (ver reemplazar) sin recalcular las medidas."""
+        salida = np.asarray(eliminados, dtype=np.float64).ravel()
+        entrada = np.asarray(agregados, dtype=np.float64).ravel()
+        if len(salida) == 0 and len(entrada) == 0:
+            return
+        # Se valida antes de modificar los conteos para no dejarlos a medias
+        if not np.isfinite(entrada).all():
+            raise ValueError("Los datos contienen valores no finitos (inf o NaN).")
+
+        if len(salida):
+            distintos, repeticiones = np.unique(salida, return_counts=True)
+            distintos = distintos.tolist()
+            repeticiones = repeticiones.tolist()
+            for valor, veces in zip(distintos, repeticiones):
+                if self.valores.get(valor, 0) < veces:
+                    raise ValueError(f"El valor '{valor}' no está en los datos.")
+            for valor, veces in zip(distintos, repeticiones):
+                self.valores[valor] -= veces
+                if self.valores[valor] == 0:
+                    del self.valores[valor]
+
+        if len(entrada):
+            distintos, repeticiones = np.unique(entrada, return_counts=True)
+            for valor, veces in zip(distintos.tolist(), repeticiones.tolist()):
+                self.valores[valor] += veces
+        self.n += len(entrada) - len(salida)
+
+        if self.n == 0:
+            self.parametros = None
+            return
+
+        extremos_cambiados = (
+            self.parametros is None
+            or self.parametros['x_min'] not in self.valores
+            or self.parametros['x_max'] not in self.valores
+            or (len(entrada) and (entrada.min() < self.parametros['x_min']
+                                  or entrada.max() > self.parametros['x_max']))
+        )
+        if extremos_cambiados or not self._actualizar_parametros():
+            self._reagrupar()
+            return
+        if len(entrada):
+            self.menores += contar_menores(entrada, self.umbrales)
+        if len(salida):
+            self.menores -= contar_menores(salida, self.umbrales)
+
+    def _actualizar_parametros(self) -> bool:
+        """
+        Recalcula los parámetros con el nuevo n y los mismos extremos.
+
+        Returns:
+            True si k y la amplitud no cambiaron (los conteos siguen siendo válidos)
+        """
+        anteriores = self.parametros
+        self.parametros = DistribucionFrecuencia.parametros_agrupacion(
+            self.n, anteriores['x_min'], anteriores['x_max'], {'datos_ordenados': None}
+        )
+        return (self.parametros['k'] == anteriores['k']
+                and self.parametros['amplitud'] == anteriores['amplitud'])
+
+    def _reagrupar(self):
+        """Vuelve a calcular parámetros y conteos a partir de todos los valores."""
+        distintos = np.fromiter(self.valores.keys(), dtype=np.float64, count=len(self.valores))
+        repeticiones = np.fromiter(self.valores.values(), dtype=np.int64, count=len(self.valores))
+
+        self.parametros = DistribucionFrecuencia.parametros_agrupacion(
+            self.n, float(distintos.min()), float(distintos.max()), {'datos_ordenados': None}
+        )
+        intervalos = DistribucionFrecuencia.crear_intervalos(
+            self.parametros['x_min'],
+            self.parametros['amplitud'],
+            self.parametros['k']
+        )
+        self.umbrales = umbrales_intervalos(intervalos)
+        self.menores = contar_menores(distintos, self.umbrales, repeticiones)
+
+    def _generar_distribucion(self) -> Tuple[TablaFrecuencias, Dict]:
+        """
+        Construye la tabla a partir de los conteos mantenidos.
+
+        Returns:
+            Tupla con (TablaFrecuencias, diccionario de parámetros)
+        """
+        k = len(self.umbrales) // 2
+        tabla = TablaFrecuencias(
+            self.umbrales[:k],
+            self.umbrales[:k] + self.parametros['amplitud'],
+            frecuencias_desde_menores(self.menores),
+            self.n
+        )
+        return tabla, self.parametros
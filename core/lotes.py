@@ -0,0 +1,156 @@
+"""
+Módulo para analizar muchos conjuntos de datos pequeños en una sola llamada.
+"""
+
+import math
+import numpy as np
+import pandas as pd
+from typing import Optional, Sequence
+
+
+def _preparar_lotes(valores, desplazamientos: Optional[Sequence[int]]):
+    """
+    Normaliza la entrada a un arreglo de valores y sus desplazamientos.
+
+    Args:
+        valores: Arreglo con todos los valores concatenados, o colección de
+                 secuencias (una por conjunto) si no se indican desplazamientos
+        desplazamientos: Índices de inicio de cada conjunto más el final
+                         (longitud m + 1)
+
+    Returns:
+        Tupla con (valores float64, desplazamientos int64)
+    """
+    if desplazamientos is None:
+        conjuntos = [np.asarray(v, dtype=np.float64).ravel() for v in valores]
+        desplazamientos = np.zeros(len(conjuntos) + 1, dtype=np.int64)
+        desplazamientos[1:] = np.cumsum([len(c) for c in conjuntos])
+        valores = np.concatenate(conjuntos) if conjuntos else np.empty(0)
+    else:
+        valores = np.ascontiguousarray(valores, dtype=np.float64)
+        desplazamientos = np.asarray(desplazamientos, dtype=np.int64)
+
+    if len(desplazamientos) < 2 or desplazamientos[0] != 0 or desplazamientos[-1] != len(valores):
+        raise ValueError("Los desplazamientos deben empezar en 0 y terminar en len(valores).")
+    if np.any(np.diff(desplazamientos) < 1):
+        raise ValueError("Cada conjunto debe tener al menos un dato.")
+    return valores, desplazamientos
+
+
+def analizar_lotes(valores, desplazamientos: Optional[Sequence[int]] = None) -> pd.DataFrame:
+    """
+    Calcula la distribución agrupada y sus medidas para muchos conjuntos a la vez.
+
+    Aplica las mismas reglas que AnalizadorEstadistico (Sturges, amplitud
+    redondeada hacia arriba, último intervalo cerrado) pero con operaciones
+    vectorizadas sobre todos los conjuntos, sin crear un analizador ni un
+    DataFrame por conjunto.
+
+    Args:
+        valores: Arreglo con todos los valores concatenados, o colección de
+                 secuencias (una por conjunto) si no se indican desplazamientos
+        desplazamientos: Índices de inicio de cada conjunto más el final
+                         (longitud m + 1), como en un arreglo irregular CSR
+
+    Returns:
+        DataFrame con una fila por conjunto y columnas n, x_min, x_max, rango,
+        k, amplitud, media, mediana, moda, desviacion_media,
+        desviacion_estandar y fi (frecuencias absolutas de cada clase)
+
+    Raises:
+        ValueError: Si algún conjunto contiene valores infinitos o NaN
+    """
+    valores, desplazamientos = _preparar_lotes(valores, desplazamientos)
+    no_finitos = np.flatnonzero(~np.isfinite(valores))
+    if len(no_finitos):
+        indice = int(np.searchsorted(desplazamientos, no_finitos[0], side='right')) - 1
+        raise ValueError(f"El conjunto {indice} contiene valores no finitos (inf o NaN).")
+    inicios = desplazamientos[:-1]
+    m = len(inicios)
+    n = np.diff(desplazamientos)
+    conjunto = np.repeat(np.arange(m), n)
+
+    # Parámetros: extremos, rango, k (Sturges) y amplitud
+    x_min = np.minimum.reduceat(valores, inicios)
+    x_max = np.maximum.reduceat(valores, inicios)
+    rango = x_max - x_min
+    distintos_n, inverso = np.unique(n, return_inverse=True)
+    k = np.array([math.ceil(1 + 3.322 * math.log10(int(v))) for v in distintos_n],
+                 dtype=np.int64)[inverso]
+    amplitud = np.ceil(rango / k)
+
+    # Límites de clase en una matriz (m, k_max) rellenada con ceros
+    k_max = int(k.max())
+    columnas = np.arange(k_max)
+    validas = columnas[None, :] < k[:, None]
+    li = x_min[:, None] + columnas[None, :] * amplitud[:, None]
+    ls = li + amplitud[:, None]
+
+    # Umbrales de cada conjunto: límites inferiores y superiores (el último
+    # superior se mueve al siguiente flotante porque el intervalo es cerrado)
+    umbral_ls = ls.copy()
+    umbral_ls[np.arange(m), k - 1] = np.nextafter(umbral_ls[np.arange(m), k - 1], np.inf)
+    fila, columna = np.nonzero(validas)
+    umbrales = np.concatenate([li[fila, columna], umbral_ls[fila, columna]])
+    conjunto_umbral = np.concatenate([fila, fila])
+
+    # Orden conjunto (conjunto, valor, tipo): un umbral va antes que los valores
+    # iguales, así los valores que lo preceden en su conjunto son los x < u
+    claves = np.concatenate([umbrales, valores])
+    conjuntos = np.concatenate([conjunto_umbral, conjunto])
+    tipo = np.concatenate([np.zeros(len(umbrales), dtype=np.int8), np.ones(len(valores), dtype=np.int8)])
+    orden = np.lexsort((tipo, claves, conjuntos))
+    es_valor = tipo[orden]
+    previos = np.cumsum(es_valor) - es_valor
+    posicion = np.empty(len(orden), dtype=np.int64)
+    posicion[orden] = np.arange(len(orden))
+    menores = previos[posicion[:len(umbrales)]] - inicios[conjunto_umbral]
+
+    # Frecuencias absolutas y acumuladas (con una columna extra de ceros)
+    total = len(fila)
+    fi = np.zeros((m, k_max + 1), dtype=np.int64)
+    fi[fila, columna] = menores[total:] - menores[:total]
+    Fi = np.cumsum(fi, axis=1)
+    xi = (li + ls) / 2
+    filas = np.arange(m)
+    amplitud_clase = ls - li
+
+    # Media
+    media = np.sum(np.where(validas, xi * fi[:, :k_max], 0.0), axis=1) / n
+
+    # Mediana: primera clase con Fi >= n/2
+    posicion_mediana = n / 2
+    clase = np.argmax(Fi[:, :k_max] >= posicion_mediana[:, None], axis=1)
+    Fi_anterior = np.where(clase > 0, Fi[filas, clase - 1], 0)
+    mediana = (li[filas, clase]
+               + (posicion_mediana - Fi_anterior) / fi[filas, clase] * amplitud_clase[filas, clase])
+
+    # Moda: clase de mayor frecuencia
+    clase = np.argmax(fi[:, :k_max], axis=1)
+    fi_modal = fi[filas, clase]
+    fi_anterior = np.where(clase > 0, fi[filas, clase - 1], 0)
+    fi_posterior = np.where(clase < k - 1, fi[filas, clase + 1], 0)
+    d1 = fi_modal - fi_anterior
+    d2 = fi_modal - fi_posterior
+    proporcion = np.divide(d1, d1 + d2, out=np.full(m, 0.5), where=(d1 + d2) != 0)
+    moda = li[filas, clase] + proporcion * amplitud_clase[filas, clase]
+
+    # Dispersión
+    desviaciones = np.where(validas, xi - media[:, None], 0.0)
+    desviacion_media = np.sum(np.abs(desviaciones) * fi[:, :k_max], axis=1) / n
+    desviacion_estandar = np.sqrt(np.sum(desviaciones ** 2 * fi[:, :k_max], axis=1) / n)
+
+    return pd.DataFrame({
+        'n': n,
+        'x_min': x_min,
+        'x_max': x_max,
+        'rango': rango,
+        'k': k,
+        'amplitud': amplitud,
+        'media': media,
+        'mediana': mediana,
+        'moda': moda,
+        'desviacion_media': desviacion_media,
+        'desviacion_estandar': desviacion_estandar,
+        'fi': [fi[i, :k[i]] for i in range(m)]
+    })
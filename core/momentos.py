@@ -0,0 +1,158 @@
+"""
+Módulo para los momentos exactos (sin agrupar) de los datos en una pasada.
+"""
+
+import math
+import numpy as np
+from typing import Dict
+
+
+class Momentos:
+    """
+    Estado combinable de los momentos centrales de los datos originales.
+
+    Guarda n, la media y las sumas de potencias de las desviaciones M2, M3 y
+    M4. Cada bloque se resume por separado y se combina con las fórmulas de
+    Welford/Pébay, que son numéricamente estables; por eso dos estados
+    calculados sobre fragmentos distintos (en bloques o en procesos) se
+    pueden unir con combinar() sin volver a leer los datos.
+    """
+
+    def __init__(self, n: int = 0, media: float = 0.0, M2: float = 0.0,
+                 M3: float = 0.0, M4: float = 0.0):
+        """
+        Inicializa el estado (por defecto vacío).
+
+        Args:
+            n: Número de datos
+            media: Media de los datos
+            M2: Σ(x - x̄)²
+            M3: Σ(x - x̄)³
+            M4: Σ(x - x̄)⁴
+        """
+        self.n = n
+        self.media = media
+        self.M2 = M2
+        self.M3 = M3
+        self.M4 = M4
+
+    @classmethod
+    def desde_bloque(cls, bloque, pesos=None) -> 'Momentos':
+        """
+        Calcula el estado de un bloque de datos en memoria.
+
+        Args:
+            bloque: Arreglo de valores numéricos
+            pesos: Repeticiones enteras de cada valor (opcional)
+
+        Returns:
+            Instancia de Momentos con los momentos del bloque
+        """
+        bloque = np.asarray(bloque, dtype=np.float64)
+        if pesos is None:
+            if len(bloque) == 0:
+                return cls()
+            media = float(bloque.mean())
+            d = bloque - media
+            d2 = d * d
+            return cls(len(bloque), media, float(d2.sum()), float((d2 * d).sum()), float((d2 * d2).sum()))
+
+        pesos = np.asarray(pesos, dtype=np.float64)
+        n = int(round(pesos.sum()))
+        if n == 0:
+            return cls()
+        media = float(np.dot(pesos, bloque)) / n
+        d = bloque - media
+        d2 = d * d
+        return cls(n, media, float(np.dot(pesos, d2)), float(np.dot(pesos, d2 * d)),
+                   float(np.dot(pesos, d2 * d2)))
+
+    def actualizar(self, bloque, pesos=None) -> 'Momentos':
+        """
+        Incorpora un bloque de datos al estado.
+
+        Args:
+            bloque: Arreglo de valores numéricos
+            pesos: Repeticiones enteras de cada valor (opcional)
+
+        Returns:
+            El mismo estado actualizado
+        """
+        return self.combinar(Momentos.desde_bloque(bloque, pesos))
+
+    def combinar(self, otro: 'Momentos') -> 'Momentos':
+        """
+        Combina este estado con otro calculado sobre datos distintos (Pébay).
+
+        Args:
+            otro: Estado de otro fragmento de datos
+
+        Returns:
+            El mismo estado actualizado
+        """
+        if otro.n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.media = otro.n, otro.media
+            self.M2, self.M3, self.M4 = otro.M2, otro.M3, otro.M4
+            return self
+
+        na, nb = self.n, otro.n
+        n = na + nb
+        delta = otro.media - self.media
+        delta_n = delta / n
+
+        M4 = (self.M4 + otro.M4
+              + delta * delta_n ** 3 * na * nb * (na * na - na * nb + nb * nb)
+              + 6 * delta_n ** 2 * (na * na * otro.M2 + nb * nb * self.M2)
+              + 4 * delta_n * (na * otro.M3 - nb * self.M3))
+        M3 = (self.M3 + otro.M3
+              + delta * delta_n ** 2 * na * nb * (na - nb)
+              + 3 * delta_n * (na * otro.M2 - nb * self.M2))
+        M2 = self.M2 + otro.M2 + delta * delta_n * na * nb
+
+        self.n = n
+        self.media = self.media + delta_n * nb
+        self.M2, self.M3, self.M4 = M2, M3, M4
+        return self
+
+    @property
+    def varianza(self) -> float:
+        """Varianza poblacional Σ(x - x̄)² / n."""
+        return self.M2 / self.n if self.n else math.nan
+
+    @property
+    def desviacion_estandar(self) -> float:
+        """Desviación estándar poblacional."""
+        return math.sqrt(self.varianza) if self.n else math.nan
+
+    @property
+    def asimetria(self) -> float:
+        """Coeficiente de asimetría g1 = √n · M3 / M2^(3/2)."""
+        if self.n == 0 or self.M2 == 0:
+            return math.nan
+        return math.sqrt(self.n) * self.M3 / self.M2 ** 1.5
+
+    @property
+    def curtosis(self) -> float:
+        """Exceso de curtosis g2 = n · M4 / M2² − 3."""
+        if self.n == 0 or self.M2 == 0:
+            return math.nan
+        return self.n * self.M4 / (self.M2 * self.M2) - 3
+
+    def a_diccionario(self) -> Dict:
+        """
+        Devuelve los momentos en un diccionario.
+
+        Returns:
+            Diccionario con n, media, varianza, desviacion_estandar,
+            asimetria y curtosis
+        """
+        return {
+            'n': self.n,
+            'media': self.media,
+            'varianza': self.varianza,
+            'desviacion_estandar': self.desviacion_estandar,
+            'asimetria': self.asimetria,
+            'curtosis': self.curtosis
+        }
@@ -0,0 +1,83 @@
+"""
+Módulo para el conteo de frecuencias en paralelo (map/reduce por procesos).
+"""
+
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Optional, Tuple
+from .conteo import Avance, contar_menores
+from .momentos import Momentos
+
+# Por debajo de esta cantidad de datos el costo de repartir supera la ganancia
+MINIMO_PARALELO = 200000
+
+
+def resolver_procesos(procesos: Optional[int]) -> int:
+    """
+    Normaliza el número de procesos solicitado.
+
+    Args:
+        procesos: Número de procesos (None usa todos los núcleos disponibles)
+
+    Returns:
+        Número de procesos mayor o igual a 1
+    """
+    if procesos is None:
+        procesos = os.cpu_count() or 1
+    return max(1, int(procesos))
+
+
+def _contar_fragmento(fragmento: np.ndarray, umbrales: np.ndarray,
+                      pesos: Optional[np.ndarray] = None) -> Tuple[np.ndarray, Momentos]:
+    """Cuenta un fragmento y resume sus momentos (se ejecuta en cada proceso)."""
+    momentos = Momentos()
+    return contar_menores(fragmento, umbrales, pesos, momentos), momentos
+
+
+def contar_menores_paralelo(datos, umbrales: np.ndarray, procesos: Optional[int] = None,
+                            momentos: Optional[Momentos] = None,
+                            pesos: Optional[np.ndarray] = None,
+                            avance: Optional[Avance] = None) -> np.ndarray:
+    """
+    Cuenta los datos menores a cada umbral repartiendo el trabajo en procesos.
+
+    Cada proceso cuenta un fragmento contiguo de los datos contra los mismos
+    umbrales y devuelve su vector parcial; los vectores se suman al final.
+    Como los conteos son enteros, el resultado es idéntico al de
+    contar_menores sobre todos los datos.
+
+    Args:
+        datos: Valores numéricos
+        umbrales: Arreglo de umbrales (ver umbrales_intervalos)
+        procesos: Número de procesos (None usa todos los núcleos disponibles)
+        momentos: Estado de Momentos que se actualiza en la misma pasada; los
+                  estados parciales de cada proceso se combinan (opcional)
+        pesos: Repeticiones enteras de cada valor (opcional); se reparten
+               en los mismos fragmentos que los datos
+        avance: Función que se llama con la fracción contada, después de
+                cada bloque (serial) o de cada fragmento (en procesos)
+
+    Returns:
+        Arreglo int64 con el conteo de datos menores a cada umbral
+    """
+    if not isinstance(datos, np.ndarray):
+        datos = np.asarray(datos, dtype=np.float64)
+    procesos = resolver_procesos(procesos)
+    if procesos == 1 or len(datos) < MINIMO_PARALELO:
+        return contar_menores(datos, umbrales, pesos, momentos, avance)
+
+    fragmentos = np.array_split(datos, procesos)
+    fragmentos_pesos = repeat(None) if pesos is None else np.array_split(pesos, procesos)
+    menores = np.zeros(len(umbrales), dtype=np.int64)
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        resultados = ejecutor.map(_contar_fragmento, fragmentos, repeat(umbrales),
+                                  fragmentos_pesos)
+        for i, (parcial, momentos_parciales) in enumerate(resultados, start=1):
+            menores += parcial
+            if momentos is not None:
+                momentos.combinar(momentos_parciales)
+            if avance is not None:
+                avance(i / procesos)
+    return menores
@@ -0,0 +1,149 @@
+"""
+Módulo con las reglas para elegir el número de clases de la distribución.
+"""
+
+import math
+import numpy as np
+from typing import Callable, Dict, Optional, Tuple
+
+# Máximo de clases que puede dar una regla. Las reglas basadas en la amplitud
+# (Scott, Freedman–Diaconis) dan k = R / h sin límite cuando hay un valor
+# atípico lejano y la dispersión es pequeña; para ellas además k <= n.
+MAXIMO_CLASES = 1000
+
+# Cada regla recibe (n, rango, datos, pesos) y devuelve (k sin redondear, fórmula)
+Regla = Callable[[int, float, Optional[np.ndarray], Optional[np.ndarray]], Tuple[float, str]]
+
+
+def cuartiles_seleccion(datos: np.ndarray, pesos: Optional[np.ndarray] = None) -> Tuple[float, float]:
+    """
+    Calcula Q1 y Q3 con selección en tiempo lineal (np.partition), sin ordenar.
+
+    Usa la misma interpolación lineal que np.percentile. Con pesos se
+    ordenan los valores distintos (no los n datos) y se ubica cada posición
+    en sus repeticiones acumuladas.
+
+    Args:
+        datos: Arreglo de valores numéricos
+        pesos: Repeticiones enteras de cada valor (opcional)
+
+    Returns:
+        Tupla con (Q1, Q3)
+    """
+    datos = np.asarray(datos, dtype=np.float64)
+    n = len(datos) if pesos is None else int(np.sum(pesos))
+    posiciones = [0.25 * (n - 1), 0.75 * (n - 1)]
+    indices = sorted({int(math.floor(p)) for p in posiciones} | {int(math.ceil(p)) for p in posiciones})
+    if pesos is None:
+        particion = np.partition(datos, indices)
+    else:
+        orden = np.argsort(datos, kind='stable')
+        acumulados = np.cumsum(np.asarray(pesos)[orden])
+        particion = dict(zip(indices, datos[orden][np.searchsorted(acumulados, indices, side='right')]))
+
+    cuartiles = []
+    for p in posiciones:
+        abajo = int(math.floor(p))
+        arriba = int(math.ceil(p))
+        cuartiles.append(float(particion[abajo] + (p - abajo) * (particion[arriba] - particion[abajo])))
+    return cuartiles[0], cuartiles[1]
+
+
+def _sturges(n: int, rango: float, datos: Optional[np.ndarray],
+             pesos: Optional[np.ndarray]) -> Tuple[float, str]:
+    """Regla de Sturges: k = 1 + 3.322 × log10(n)."""
+    k_decimal = 1 + 3.322 * math.log10(n)
+    return k_decimal, f"k = 1 + 3.322 × log10(n) = 1 + 3.322 × log10({n}) = {k_decimal:.4f}"
+
+
+def _rice(n: int, rango: float, datos: Optional[np.ndarray],
+          pesos: Optional[np.ndarray]) -> Tuple[float, str]:
+    """Regla de Rice: k = 2 × n^(1/3)."""
+    k_decimal = 2 * n ** (1 / 3)
+    return k_decimal, f"k = 2 × n^(1/3) = 2 × {n}^(1/3) = {k_decimal:.4f}"
+
+
+def _raiz(n: int, rango: float, datos: Optional[np.ndarray],
+          pesos: Optional[np.ndarray]) -> Tuple[float, str]:
+    """Regla de la raíz cuadrada: k = √n."""
+    k_decimal = math.sqrt(n)
+    return k_decimal, f"k = √n = √{n} = {k_decimal:.4f}"
+
+
+def _por_amplitud(h: float, rango: float, formula_h: str) -> Tuple[float, str]:
+    """Convierte una amplitud teórica h en k = R / h."""
+    if h <= 0:
+        # Dispersión nula: una sola clase
+        return 1.0, f"{formula_h} → k = 1"
+    k_decimal = rango / h
+    return k_decimal, f"{formula_h}; k = R / h = {rango} / {h:.4f} = {k_decimal:.4f}"
+
+
+def _scott(n: int, rango: float, datos: Optional[np.ndarray],
+           pesos: Optional[np.ndarray]) -> Tuple[float, str]:
+    """Regla de Scott: h = 3.49 × s × n^(-1/3)."""
+    if pesos is None:
+        s = float(np.std(datos))
+    else:
+        media = float(np.dot(pesos, datos)) / n
+        s = math.sqrt(float(np.dot(pesos, (datos - media) ** 2)) / n)
+    h = 3.49 * s * n ** (-1 / 3)
+    return _por_amplitud(h, rango, f"h = 3.49 × s × n^(-1/3) = 3.49 × {s:.4f} × {n}^(-1/3) = {h:.4f}")
+
+
+def _freedman_diaconis(n: int, rango: float, datos: Optional[np.ndarray],
+                       pesos: Optional[np.ndarray]) -> Tuple[float, str]:
+    """Regla de Freedman–Diaconis: h = 2 × IQR × n^(-1/3)."""
+    q1, q3 = cuartiles_seleccion(datos, pesos)
+    iqr = q3 - q1
+    h = 2 * iqr * n ** (-1 / 3)
+    return _por_amplitud(
+        h, rango,
+        f"IQR = Q3 - Q1 = {q3:.4f} - {q1:.4f} = {iqr:.4f}; "
+        f"h = 2 × IQR × n^(-1/3) = 2 × {iqr:.4f} × {n}^(-1/3) = {h:.4f}"
+    )
+
+
+# clave -> (nombre para mostrar, función, necesita los datos)
+REGLAS: Dict[str, Tuple[str, Regla, bool]] = {
+    'sturges': ('Regla de Sturges', _sturges, False),
+    'scott': ('Regla de Scott', _scott, True),
+    'freedman_diaconis': ('Regla de Freedman–Diaconis', _freedman_diaconis, True),
+    'rice': ('Regla de Rice', _rice, False),
+    'raiz': ('Regla de la raíz cuadrada', _raiz, False),
+}
+
+
+def numero_clases(regla: str, n: int, rango: float, datos: Optional[np.ndarray] = None,
+                  pesos: Optional[np.ndarray] = None) -> Tuple[int, float, str]:
+    """
+    Calcula el número de clases con la regla indicada en O(n).
+
+    El resultado se limita a MAXIMO_CLASES (y a n en las reglas basadas en
+    la amplitud); si se aplica el límite queda indicado en la fórmula.
+
+    Args:
+        regla: Clave de la regla (ver REGLAS)
+        n: Número de datos
+        rango: Rango de los datos
+        datos: Valores (solo necesarios para Scott y Freedman–Diaconis)
+        pesos: Repeticiones enteras de cada valor (opcional)
+
+    Returns:
+        Tupla con (k, k sin redondear, fórmula con la sustitución)
+    """
+    if regla not in REGLAS:
+        raise ValueError(f"Regla de número de clases desconocida: '{regla}'.")
+    _, funcion, necesita_datos = REGLAS[regla]
+    if necesita_datos and datos is None:
+        raise ValueError(f"La regla '{regla}' necesita los datos en memoria.")
+
+    k_decimal, formula = funcion(n, rango, datos, pesos)
+    if necesita_datos:
+        k_maximo, limite = max(1, min(n, MAXIMO_CLASES)), f"mín(n, {MAXIMO_CLASES})"
+    else:
+        k_maximo, limite = MAXIMO_CLASES, str(MAXIMO_CLASES)
+    if k_decimal > k_maximo:
+        return k_maximo, k_decimal, f"{formula}; k limitado a {limite} = {k_maximo}"
+    k = max(1, math.ceil(k_decimal))
+    return k, k_decimal, f"{formula} ≈ {k}"
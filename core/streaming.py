@@ -0,0 +1,150 @@
+"""
+Módulo para el análisis de datos que no caben en memoria (modo streaming).
+"""
+
+import re
+import numpy as np
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+from .conteo import umbrales_intervalos, contar_menores, frecuencias_desde_menores
+from .distribucion_frecuencia import DistribucionFrecuencia
+from .estadistica import AnalizadorEstadistico
+from .momentos import Momentos
+from .resumen_cuantiles import ResumenCuantiles
+from .tabla_frecuencias import TablaFrecuencias
+
+
+class BloquesArchivo:
+    """
+    Fuente re-iterable que lee un archivo de texto por bloques.
+
+    Cada iteración vuelve a abrir el archivo, por lo que puede recorrerse las
+    dos veces que necesita AnalizadorStreaming. Los valores pueden estar
+    separados por comas, espacios o saltos de línea.
+    """
+
+    SEPARADORES = re.compile(r'[,\s]+')
+
+    def __init__(self, ruta: str, lineas_por_bloque: int = 100000):
+        """
+        Inicializa la fuente.
+
+        Args:
+            ruta: Ruta del archivo de texto
+            lineas_por_bloque: Cantidad de líneas que se convierten por bloque
+        """
+        self.ruta = ruta
+        self.lineas_por_bloque = lineas_por_bloque
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        with open(self.ruta, 'r', encoding='utf-8') as archivo:
+            lineas = []
+            for linea in archivo:
+                lineas.append(linea)
+                if len(lineas) >= self.lineas_por_bloque:
+                    yield self._convertir(lineas)
+                    lineas = []
+            if lineas:
+                yield self._convertir(lineas)
+
+    def _convertir(self, lineas) -> np.ndarray:
+        """Convierte un bloque de líneas en un arreglo float64."""
+        elementos = self.SEPARADORES.split(''.join(lineas))
+        return np.array([e for e in elementos if e], dtype=np.float64)
+
+
+class AnalizadorStreaming(AnalizadorEstadistico):
+    """
+    Analizador que recorre los datos por bloques sin cargarlos completos.
+
+    Hace dos pasadas sobre la fuente: la primera obtiene n, el mínimo y el
+    máximo para fijar k y la amplitud; la segunda acumula los
+    conteos de cada clase. La memoria depende del tamaño de bloque, no de n.
+    Opcionalmente la primera pasada alimenta un ResumenCuantiles, cuya
+    mediana no depende de la agrupación.
+    """
+
+    def __init__(self, fuente: Union[Iterable, Callable[[], Iterator]],
+                 detallado: bool = True, resumen_cuantiles: Optional[int] = None,
+                 regla: str = 'sturges'):
+        """
+        Inicializa el analizador con la fuente de bloques.
+
+        Args:
+            fuente: Iterable que pueda recorrerse dos veces (lista de arreglos,
+                    BloquesArchivo, ...) o función sin argumentos que devuelva
+                    un iterador nuevo de bloques en cada llamada
+            detallado: Si es False solo se calculan los valores numéricos
+            resumen_cuantiles: Parámetro k del resumen KLL de cuantiles
+                               aproximados (None = no se calcula)
+            regla: Regla del número de clases; solo las que dependen únicamente
+                   de n ('sturges', 'rice' o 'raiz'), porque los datos no
+                   están en memoria
+        """
+        super().__init__(None, detallado=detallado, regla=regla)
+        self.fuente = fuente
+        self.k_resumen = resumen_cuantiles
+
+    def _bloques(self) -> Iterator[np.ndarray]:
+        """Devuelve un iterador nuevo sobre los bloques de la fuente."""
+        if callable(self.fuente):
+            bloques = self.fuente()
+        else:
+            bloques = iter(self.fuente)
+            if bloques is self.fuente:
+                raise TypeError(
+                    "La fuente debe poder recorrerse dos veces: use una lista, "
+                    "BloquesArchivo o una función que devuelva un iterador."
+                )
+        for bloque in bloques:
+            bloque = np.asarray(bloque, dtype=np.float64).ravel()
+            if len(bloque):
+                yield bloque
+
+    def _generar_distribucion(self) -> Tuple[TablaFrecuencias, Dict]:
+        """
+        Genera la tabla de frecuencias en dos pasadas sobre los bloques.
+
+        Returns:
+            Tupla con (TablaFrecuencias, diccionario de parámetros)
+        """
+        # Primera pasada: n, mínimo, máximo y resumen de cuantiles
+        n = 0
+        x_min = np.inf
+        x_max = -np.inf
+        if self.k_resumen is not None:
+            self.resumen = ResumenCuantiles(self.k_resumen)
+        for bloque in self._bloques():
+            n += len(bloque)
+            # np.minimum y np.maximum propagan los NaN hasta la validación
+            # de los extremos en parametros_agrupacion
+            x_min = np.minimum(x_min, bloque.min())
+            x_max = np.maximum(x_max, bloque.max())
+            if self.resumen is not None:
+                self.resumen.agregar_lote(bloque)
+
+        if n == 0:
+            raise ValueError("La fuente no contiene datos.")
+
+        # Los datos ordenados no se conservan en este modo
+        pasos = {'datos_ordenados': None}
+        parametros = DistribucionFrecuencia.parametros_agrupacion(
+            n, float(x_min), float(x_max), pasos, self.regla
+        )
+        intervalos = DistribucionFrecuencia.crear_intervalos(
+            parametros['x_min'],
+            parametros['amplitud'],
+            parametros['k']
+        )
+
+        # Segunda pasada: conteos acumulados por clase y momentos exactos
+        umbrales = umbrales_intervalos(intervalos)
+        menores = np.zeros(len(umbrales), dtype=np.int64)
+        self.momentos = Momentos()
+        for bloque in self._bloques():
+            menores += contar_menores(bloque, umbrales, momentos=self.momentos)
+
+        limites = np.asarray(intervalos, dtype=np.float64).reshape(-1, 2)
+        tabla = TablaFrecuencias(
+            limites[:, 0], limites[:, 1], frecuencias_desde_menores(menores), n
+        )
+        return tabla, parametros
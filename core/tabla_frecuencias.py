@@ -0,0 +1,180 @@
+"""
+Módulo con la estructura de la tabla de distribución de frecuencias.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Union
+
+
+class TablaFrecuencias:
+    """
+    Tabla de distribución de frecuencias respaldada por arreglos numéricos.
+
+    Las columnas Li, Ls, xi, fi, Fi y hi se guardan como arreglos contiguos
+    y los totales como escalares separados. El DataFrame con la fila 'TOTAL'
+    solo se construye para mostrarlo (ver a_dataframe).
+    """
+
+    COLUMNAS = [
+        'Intervalo',
+        'Li',
+        'Ls',
+        'xi (Marca de Clase)',
+        'fi (Frec. Absoluta)',
+        'Fi (Frec. Acumulada)',
+        'hi (Frec. Relativa)',
+        'hi% (Frec. Relativa %)'
+    ]
+
+    def __init__(self, li, ls, fi, n: int):
+        """
+        Inicializa la tabla a partir de los límites y las frecuencias absolutas.
+
+        Args:
+            li: Límites inferiores de cada clase
+            ls: Límites superiores de cada clase
+            fi: Frecuencia absoluta de cada clase
+            n: Número total de datos
+        """
+        self.li = np.ascontiguousarray(li, dtype=np.float64)
+        self.ls = np.ascontiguousarray(ls, dtype=np.float64)
+        self.xi = (self.li + self.ls) / 2
+        self.fi = np.ascontiguousarray(fi, dtype=np.int64)
+        self.Fi = np.cumsum(self.fi)
+        self.hi = self.fi / n
+        self.hi_porcentaje = self.hi * 100
+
+        # Totales
+        self.n = int(n)
+        self.total_hi = 1.00
+        self.total_hi_porcentaje = 100.00
+
+    @property
+    def k(self) -> int:
+        """Número de clases."""
+        return len(self.fi)
+
+    def intervalo(self, i: int) -> str:
+        """
+        Devuelve la etiqueta del intervalo de la clase i.
+
+        Args:
+            i: Índice de la clase
+
+        Returns:
+            Texto con el formato "[Li - Ls)"
+        """
+        return f"[{self.li[i]:.2f} - {self.ls[i]:.2f})"
+
+    def clase_cuantil(self, posicion):
+        """
+        Busca la clase que contiene una posición acumulada (primera con Fi >= posición).
+
+        Args:
+            posicion: Posición p·n o arreglo de posiciones
+
+        Returns:
+            Índice (o arreglo de índices) de la clase
+        """
+        return np.searchsorted(self.Fi, posicion, side='left')
+
+    def cuantil(self, p) -> Union[float, np.ndarray]:
+        """
+        Calcula cuantiles agrupados con Li + [(p·n - Fi-1) / fi] × A.
+
+        La clase de cada cuantil se obtiene por búsqueda binaria sobre la
+        columna Fi, así que muchas consultas cuestan O(m log k).
+
+        Args:
+            p: Proporción entre 0 y 1, o arreglo de proporciones
+
+        Returns:
+            Valor del cuantil (float) o arreglo con un valor por proporción
+        """
+        escalar = np.ndim(p) == 0
+        p = np.asarray(p, dtype=np.float64)
+        if np.any((p < 0) | (p > 1)) or np.any(np.isnan(p)):
+            raise ValueError("Las proporciones de los cuantiles deben estar entre 0 y 1.")
+
+        posicion = p * self.n
+        i = self.clase_cuantil(posicion)
+        Fi_anterior = np.where(i > 0, self.Fi[i - 1], 0)
+        A = self.ls[i] - self.li[i]
+        valores = self.li[i] + ((posicion - Fi_anterior) / self.fi[i]) * A
+        return float(valores) if escalar else valores
+
+    def cuartiles(self) -> np.ndarray:
+        """Cuartiles Q1, Q2 y Q3."""
+        return self.cuantil(np.arange(1, 4) / 4)
+
+    def deciles(self) -> np.ndarray:
+        """Deciles D1 a D9."""
+        return self.cuantil(np.arange(1, 10) / 10)
+
+    def percentiles(self, k=None) -> Union[float, np.ndarray]:
+        """
+        Calcula percentiles agrupados.
+
+        Args:
+            k: Percentil entre 0 y 100 o arreglo de percentiles
+               (por defecto P1 a P99)
+
+        Returns:
+            Valor del percentil o arreglo con un valor por percentil
+        """
+        if k is None:
+            k = np.arange(1, 100)
+        return self.cuantil(np.asarray(k, dtype=np.float64) / 100)
+
+    def a_dataframe(self) -> pd.DataFrame:
+        """
+        Construye la vista del DataFrame para mostrar, con la fila de totales.
+
+        Returns:
+            DataFrame con la tabla de distribución de frecuencias
+        """
+        df = pd.DataFrame({
+            'Intervalo': [self.intervalo(i) for i in range(self.k)],
+            'Li': self.li,
+            'Ls': self.ls,
+            'xi (Marca de Clase)': self.xi,
+            'fi (Frec. Absoluta)': self.fi,
+            'Fi (Frec. Acumulada)': self.Fi,
+            'hi (Frec. Relativa)': self.hi,
+            'hi% (Frec. Relativa %)': self.hi_porcentaje
+        })
+
+        # Agregar fila de totales
+        totales = {
+            'Intervalo': 'TOTAL',
+            'Li': '',
+            'Ls': '',
+            'xi (Marca de Clase)': '',
+            'fi (Frec. Absoluta)': self.n,
+            'Fi (Frec. Acumulada)': '',
+            'hi (Frec. Relativa)': self.total_hi,
+            'hi% (Frec. Relativa %)': self.total_hi_porcentaje
+        }
+        return pd.concat([df, pd.DataFrame([totales])], ignore_index=True)
+
+    @classmethod
+    def desde_dataframe(cls, tabla: pd.DataFrame) -> 'TablaFrecuencias':
+        """
+        Crea la tabla a partir de un DataFrame con fila 'TOTAL'.
+
+        Args:
+            tabla: DataFrame generado por DistribucionFrecuencia.calcular_frecuencias
+
+        Returns:
+            Instancia de TablaFrecuencias
+        """
+        es_total = (tabla['Intervalo'] == 'TOTAL').to_numpy()
+        clases = tabla[~es_total]
+        n = int(tabla.loc[es_total, 'fi (Frec. Absoluta)'].to_numpy()[0])
+        return cls(
+            clases['Li'].to_numpy(dtype=np.float64),
+            clases['Ls'].to_numpy(dtype=np.float64),
+            clases['fi (Frec. Absoluta)'].to_numpy(dtype=np.int64),
+            n
+        )
@@ -2,41 +2,53 @@
 Módulo para calcular medidas de tendencia central para datos agrupados.
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Union
+from .tabla_frecuencias import TablaFrecuencias
 
 
 class TendenciaCentral:
     """Clase para calcular medidas de tendencia central."""
     
-    def __init__(self, tabla: pd.DataFrame):
+    def __init__(self, tabla: Union[TablaFrecuencias, pd.DataFrame]):
         """
         Inicializa la clase con la tabla de distribución de frecuencias.
         
         Args:
-            tabla: DataFrame con la tabla de frecuencias (sin fila de totales)
+            tabla: TablaFrecuencias (o DataFrame con fila de totales)
         """
-        # Excluir la fila de totales
-        self.tabla = tabla[tabla['Intervalo'] != 'TOTAL'].copy()
-        self.n = int(tabla[tabla['Intervalo'] == 'TOTAL']['fi (Frec. Absoluta)'].values[0])
+        if isinstance(tabla, pd.DataFrame):
+            tabla = TablaFrecuencias.desde_dataframe(tabla)
+        self.tabla = tabla
+        self.n = tabla.n
         
-    def calcular_media(self) -> Tuple[float, Dict]:
+    def calcular_media(self, detallado: bool = True) -> Tuple[float, Dict]:
         """
         Calcula la media aritmética para datos agrupados.
         
+        Args:
+            detallado: Si es False solo se calcula el valor, sin tablas ni
+                       fórmulas de pasos (el diccionario se devuelve vacío)
+            
         Returns:
             Tupla con (resultado, diccionario de pasos)
         """
+        xi_fi = self.tabla.xi * self.tabla.fi
+        if not detallado:
+            return float(xi_fi.sum()) / self.n, {}
+        
         pasos = {}
         
         # Crear tabla de cálculos
-        tabla_calculos = self.tabla[['xi (Marca de Clase)', 'fi (Frec. Absoluta)']].copy()
-        tabla_calculos['xi * fi'] = tabla_calculos['xi (Marca de Clase)'] * tabla_calculos['fi (Frec. Absoluta)']
-        
-        pasos['tabla'] = tabla_calculos
+        pasos['tabla'] = pd.DataFrame({
+            'xi (Marca de Clase)': self.tabla.xi,
+            'fi (Frec. Absoluta)': self.tabla.fi,
+            'xi * fi': xi_fi
+        })
         
         # Calcular suma
-        suma_xi_fi = tabla_calculos['xi * fi'].sum()
+        suma_xi_fi = float(xi_fi.sum())
         pasos['suma_xi_fi'] = suma_xi_fi
         pasos['formula_suma'] = f"Σ(xi × fi) = {suma_xi_fi:.4f}"
         
@@ -47,51 +59,47 @@ class TendenciaCentral:
         
         return media, pasos
     
-    def calcular_mediana(self) -> Tuple[float, Dict]:
+    def calcular_mediana(self, detallado: bool = True) -> Tuple[float, Dict]:
         """
         Calcula la mediana para datos agrupados.
         
+        Args:
+            detallado: Si es False solo se calcula el valor, sin tablas ni
+                       fórmulas de pasos (el diccionario se devuelve vacío)
+            
         Returns:
             Tupla con (resultado, diccionario de pasos)
         """
-        pasos = {}
-        
         # Posición de la mediana
         posicion_mediana = self.n / 2
-        pasos['posicion'] = posicion_mediana
-        pasos['formula_posicion'] = f"n/2 = {self.n}/2 = {posicion_mediana}"
         
-        # Encontrar clase mediana (donde Fi >= n/2)
-        clase_mediana_idx = None
-        for idx, row in self.tabla.iterrows():
-            if row['Fi (Frec. Acumulada)'] >= posicion_mediana:
-                clase_mediana_idx = idx
-                break
-        
-        clase_mediana = self.tabla.loc[clase_mediana_idx]
-        pasos['clase_mediana'] = clase_mediana['Intervalo']
+        # Encontrar clase mediana (primera donde Fi >= n/2)
+        i = int(self.tabla.clase_cuantil(posicion_mediana))
         
         # Parámetros para la fórmula
-        Li = clase_mediana['Li']
-        fi = clase_mediana['fi (Frec. Absoluta)']
+        Li = float(self.tabla.li[i])
+        fi = int(self.tabla.fi[i])
         
         # Frecuencia acumulada anterior
-        if clase_mediana_idx == self.tabla.index[0]:
-            Fi_anterior = 0
-        else:
-            Fi_anterior = self.tabla.loc[clase_mediana_idx - 1, 'Fi (Frec. Acumulada)']
+        Fi_anterior = int(self.tabla.Fi[i - 1]) if i > 0 else 0
         
         # Amplitud (diferencia entre límites)
-        A = clase_mediana['Ls'] - clase_mediana['Li']
+        A = float(self.tabla.ls[i] - self.tabla.li[i])
         
+        # Calcular mediana
+        mediana = Li + ((posicion_mediana - Fi_anterior) / fi) * A
+        if not detallado:
+            return mediana, {}
+        
+        pasos = {}
+        pasos['posicion'] = posicion_mediana
+        pasos['formula_posicion'] = f"n/2 = {self.n}/2 = {posicion_mediana}"
+        pasos['clase_mediana'] = self.tabla.intervalo(i)
         pasos['Li'] = Li
         pasos['fi'] = fi
         pasos['Fi_anterior'] = Fi_anterior
         pasos['A'] = A
         
-        # Calcular mediana
-        mediana = Li + ((posicion_mediana - Fi_anterior) / fi) * A
-        
         pasos['formula'] = f"Me = Li + [(n/2 - Fi-1) / fi] × A"
         pasos['sustitucion'] = f"Me = {Li} + [({posicion_mediana} - {Fi_anterior}) / {fi}] × {A}"
         pasos['calculo'] = f"Me = {Li} + [{posicion_mediana - Fi_anterior} / {fi}] × {A}"
@@ -100,45 +108,47 @@ class TendenciaCentral:
         
         return mediana, pasos
     
-    def calcular_moda(self) -> Tuple[float, Dict]:
+    def calcular_moda(self, detallado: bool = True) -> Tuple[float, Dict]:
         """
         Calcula la moda para datos agrupados.
         
+        Args:
+            detallado: Si es False solo se calcula el valor, sin tablas ni
+                       fórmulas de pasos (el diccionario se devuelve vacío)
+            
         Returns:
             Tupla con (resultado, diccionario de pasos)
         """
-        pasos = {}
-        
         # Encontrar clase modal (mayor frecuencia)
-        clase_modal_idx = self.tabla['fi (Frec. Absoluta)'].idxmax()
-        clase_modal = self.tabla.loc[clase_modal_idx]
-        
-        pasos['clase_modal'] = clase_modal['Intervalo']
-        pasos['fi_modal'] = clase_modal['fi (Frec. Absoluta)']
+        i = int(np.argmax(self.tabla.fi))
         
         # Parámetros para la fórmula
-        Li = clase_modal['Li']
-        fi_modal = clase_modal['fi (Frec. Absoluta)']
+        Li = float(self.tabla.li[i])
+        fi_modal = int(self.tabla.fi[i])
         
         # Frecuencia anterior
-        if clase_modal_idx == self.tabla.index[0]:
-            fi_anterior = 0
-        else:
-            fi_anterior = self.tabla.loc[clase_modal_idx - 1, 'fi (Frec. Absoluta)']
+        fi_anterior = int(self.tabla.fi[i - 1]) if i > 0 else 0
         
         # Frecuencia posterior
-        if clase_modal_idx == self.tabla.index[-1]:
-            fi_posterior = 0
-        else:
-            fi_posterior = self.tabla.loc[clase_modal_idx + 1, 'fi (Frec. Absoluta)']
+        fi_posterior = int(self.tabla.fi[i + 1]) if i < self.tabla.k - 1 else 0
         
         # Amplitud
-        A = clase_modal['Ls'] - clase_modal['Li']
+        A = float(self.tabla.ls[i] - self.tabla.li[i])
         
         # Diferencias
         d1 = fi_modal - fi_anterior
         d2 = fi_modal - fi_posterior
         
+        # Calcular moda
+        if d1 + d2 == 0:
+            moda = Li + A / 2  # Si no hay diferencia, usar punto medio
+        else:
+            moda = Li + (d1 / (d1 + d2)) * A
+        if not detallado:
+            return moda, {}
+        
+        pasos = {}
+        pasos['clase_modal'] = self.tabla.intervalo(i)
         pasos['Li'] = Li
         pasos['fi_modal'] = fi_modal
         pasos['fi_anterior'] = fi_anterior
@@ -147,12 +157,6 @@ class TendenciaCentral:
         pasos['d2'] = d2
         pasos['A'] = A
         
-        # Calcular moda
-        if d1 + d2 == 0:
-            moda = Li + A / 2  # Si no hay diferencia, usar punto medio
-        else:
-            moda = Li + (d1 / (d1 + d2)) * A
-        
         pasos['formula'] = f"Mo = Li + [d1 / (d1 + d2)] × A"
         pasos['d1_formula'] = f"d1 = fi_modal - fi_anterior = {fi_modal} - {fi_anterior} = {d1}"
         pasos['d2_formula'] = f"d2 = fi_modal - fi_posterior = {fi_modal} - {fi_posterior} = {d2}"
@@ -0,0 +1,119 @@
+"""
+Módulo para estadísticas agrupadas sobre ventanas de un flujo de datos.
+"""
+
+import math
+import time
+from collections import deque
+from typing import Dict, Optional
+from .incremental import AnalizadorIncremental
+
+
+class AnalizadorVentana:
+    """
+    Analizador de ventanas deslizantes o fijas sobre un flujo de mediciones.
+
+    La ventana se define por cantidad de muestras (tamano), por tiempo
+    (duracion, en segundos) o por ambos. Las muestras se guardan en un búfer
+    circular y los conteos por clase se mantienen con AnalizadorIncremental:
+    expirar una muestra cuesta O(1) salvo que sea el mínimo o el máximo de la
+    ventana, o que cambie k, en cuyo caso se reagrupa la ventana completa.
+    """
+
+    TIPOS = ('deslizante', 'fija')
+
+    def __init__(self, tamano: Optional[int] = None, duracion: Optional[float] = None,
+                 tipo: str = 'deslizante', detallado: bool = True):
+        """
+        Inicializa el analizador de ventana.
+
+        Args:
+            tamano: Número máximo de muestras en la ventana
+            duracion: Duración máxima de la ventana en segundos
+            tipo: 'deslizante' (últimas N muestras / T segundos) o 'fija'
+                  (ventanas consecutivas sin solapamiento)
+            detallado: Si es False cada muestra solo actualiza los valores
+                       numéricos, sin tablas ni fórmulas de pasos
+        """
+        if tamano is None and duracion is None:
+            raise ValueError("Debe indicar el tamaño o la duración de la ventana.")
+        if tamano is not None and tamano < 1:
+            raise ValueError("El tamaño de la ventana debe ser al menos 1.")
+        if tipo not in self.TIPOS:
+            raise ValueError(f"Tipo de ventana desconocido: '{tipo}'.")
+
+        self.tamano = tamano
+        self.duracion = duracion
+        self.tipo = tipo
+        self.detallado = detallado
+        self.muestras = deque()   # (marca_tiempo, valor)
+        self.inicio_ventana = None
+        self.analizador = AnalizadorIncremental(detallado=detallado)
+
+    @property
+    def resultados(self) -> Dict:
+        """Resultados de la ventana actual (mismo formato que calcular_todo)."""
+        return self.analizador.resultados
+
+    def agregar(self, valor: float, marca_tiempo: Optional[float] = None) -> Dict:
+        """
+        Agrega una muestra, expira las que quedan fuera y actualiza los resultados.
+
+        Args:
+            valor: Valor medido
+            marca_tiempo: Instante de la medición en segundos (por defecto el reloj
+                          monotónico del sistema)
+
+        Returns:
+            Diccionario con los resultados de la ventana actual
+
+        Raises:
+            ValueError: Si el valor es infinito o NaN (la ventana no cambia)
+        """
+        if not math.isfinite(valor):
+            raise ValueError("Los datos contienen valores no finitos (inf o NaN).")
+        if marca_tiempo is None:
+            marca_tiempo = time.monotonic()
+
+        expiradas = []
+        if self.tipo == 'fija':
+            if self.inicio_ventana is None or self._ventana_cerrada(marca_tiempo):
+                self.muestras.clear()
+                self.analizador = AnalizadorIncremental(detallado=self.detallado)
+                self.inicio_ventana = marca_tiempo
+        else:
+            expiradas = self._expirar(marca_tiempo)
+
+        # La expiración y la nueva muestra se aplican como un solo lote: con la
+        # ventana llena n no cambia y los parámetros se comparan una sola vez
+        self.muestras.append((marca_tiempo, valor))
+        return self.analizador.reemplazar(expiradas, [valor])
+
+    def _ventana_cerrada(self, marca_tiempo: float) -> bool:
+        """Indica si la ventana fija actual ya no admite la nueva muestra."""
+        if self.tamano is not None and len(self.muestras) >= self.tamano:
+            return True
+        if self.duracion is not None and marca_tiempo - self.inicio_ventana >= self.duracion:
+            return True
+        return False
+
+    def _expirar(self, marca_tiempo: float) -> list:
+        """
+        Retira del búfer las muestras que quedan fuera al llegar una nueva.
+
+        Args:
+            marca_tiempo: Instante de la nueva muestra
+
+        Returns:
+            Lista con los valores expirados
+        """
+        expiradas = []
+        while self.muestras:
+            marca, valor = self.muestras[0]
+            excede_tamano = self.tamano is not None and len(self.muestras) >= self.tamano
+            excede_tiempo = self.duracion is not None and marca_tiempo - marca > self.duracion
+            if not (excede_tamano or excede_tiempo):
+                break
+            self.muestras.popleft()
+            expiradas.append(valor)
+        return expiradas
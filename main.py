@@ -1,26 +1,34 @@
 """
 Punto de entrada principal de la aplicación.
+
+Sin argumentos abre la interfaz gráfica. Con un subcomando (por ejemplo
+`python main.py analyze --input datos.csv`) ejecuta la línea de comandos,
+que no importa PyQt6.
 """
 
 import sys
-from PyQt6.QtWidgets import QApplication
-from ui.main_window import MainWindow
 
 
 def main():
     """Función principal que inicia la aplicación."""
+    from PyQt6.QtWidgets import QApplication
+    from ui.main_window import MainWindow
+
     app = QApplication(sys.argv)
-    
+
     # Configurar estilo de la aplicación
     app.setStyle("Fusion")
-    
+
     # Crear y mostrar ventana principal
     window = MainWindow()
     window.show()
-    
+
     # Ejecutar aplicación
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and not sys.argv[1].startswith('-'):
+        import cli
+        sys.exit(cli.main())
     main()
@@ -3,15 +3,16 @@ Widget para la entrada de datos.
 """
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QTextEdit, QPushButton, 
-                              QLabel, QMessageBox, QHBoxLayout)
+                              QLabel, QMessageBox, QHBoxLayout, QCheckBox)
 from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtGui import QFont
+from core.conversion_texto import convertir_numeros, ErrorFormato
 
 
 class DataInputWidget(QWidget):
     """Widget para ingresar datos numéricos."""
     
-    dataReady = pyqtSignal(list)  # Señal que emite los datos validados
+    dataReady = pyqtSignal(object)  # Señal que emite los datos validados (arreglo float64)
     
     def __init__(self):
         super().__init__()
@@ -34,7 +35,8 @@ class DataInputWidget(QWidget):
             "Ingrese los datos numéricos separados por:\n"
             "• Comas (,)\n"
             "• Espacios\n"
-            "• Saltos de línea"
+            "• Saltos de línea\n"
+            "Con coma decimal, separe los valores con punto y coma (;)"
         )
         layout.addWidget(instrucciones)
         
@@ -46,6 +48,10 @@ class DataInputWidget(QWidget):
         self.text_edit.setMinimumHeight(200)
         layout.addWidget(self.text_edit)
         
+        # Opción de coma decimal (los valores se separan con punto y coma)
+        self.check_coma_decimal = QCheckBox("Coma decimal (1,5; 2,75)")
+        layout.addWidget(self.check_coma_decimal)
+        
         # Label para mostrar cantidad de datos
         self.label_cantidad = QLabel("Datos ingresados: 0")
         layout.addWidget(self.label_cantidad)
@@ -97,9 +103,11 @@ class DataInputWidget(QWidget):
         
     def validar_y_calcular(self):
         """Valida los datos ingresados y emite señal si son válidos."""
-        texto = self.text_edit.toPlainText().strip()
+        # El texto se convierte sin recortar para que la línea y la columna de
+        # un valor inválido coincidan con las del editor
+        texto = self.text_edit.toPlainText()
         
-        if not texto:
+        if not texto.strip():
             QMessageBox.warning(
                 self,
                 "Datos vacíos",
@@ -107,24 +115,18 @@ class DataInputWidget(QWidget):
             )
             return
         
-        # Separar por comas, espacios y saltos de línea
-        import re
-        elementos = re.split(r'[,\s\n]+', texto)
-        elementos = [e.strip() for e in elementos if e.strip()]
-        
-        # Convertir a números
-        datos = []
-        for elemento in elementos:
-            try:
-                numero = float(elemento)
-                datos.append(numero)
-            except ValueError:
-                QMessageBox.critical(
-                    self,
-                    "Error de formato",
-                    f"El valor '{elemento}' no es un número válido."
-                )
-                return
+        # Convertir todo el texto de una vez; si falla se informa la posición
+        # del primer valor inválido
+        try:
+            datos = convertir_numeros(texto, self.check_coma_decimal.isChecked())
+        except ErrorFormato as e:
+            QMessageBox.critical(
+                self,
+                "Error de formato",
+                f"El valor '{e.elemento}' no es un número válido.\n"
+                f"Línea {e.linea}, columna {e.columna}."
+            )
+            return
         
         # Validar cantidad mínima
         if len(datos) < 5:
@@ -5,12 +5,23 @@ Widget para mostrar gráficas estadísticas.
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QDialog
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QIcon
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import pandas as pd
-import matplotlib.pyplot as plt
 import os
 
+# matplotlib se importa al crear la primera gráfica (ver _cargar_matplotlib),
+# no al iniciar la aplicación
+Figure = None
+FigureCanvas = None
+cm = None
+
+
+def _cargar_matplotlib():
+    """Importa matplotlib y su backend de Qt la primera vez que se necesitan."""
+    global Figure, FigureCanvas, cm
+    if cm is None:
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+        from matplotlib import cm
+
 
 class GraficasWidget(QWidget):
     """Widget que muestra gráficas estadísticas."""
@@ -154,7 +165,7 @@ class GraficasWidget(QWidget):
         self.datos_grafica = None
         self.resultados = None
         
-    def mostrar_graficas(self, tabla: pd.DataFrame, resultados: dict):
+    def mostrar_graficas(self, tabla, resultados: dict):
         """Prepara los datos para las gráficas y habilita los botones."""
         try:
             # Validar que la tabla tenga datos
@@ -363,11 +374,12 @@ class GraficasWidget(QWidget):
         
     def crear_grafica_barras(self, intervalos, frecuencias):
         """Crea una gráfica de barras."""
+        _cargar_matplotlib()
         fig = Figure(figsize=(6, 4), facecolor='white')
         ax = fig.add_subplot(111)
         
         # Crear barras
-        colores = plt.cm.Blues(range(50, 200, int(150/len(frecuencias))))
+        colores = cm.Blues(range(50, 200, int(150/len(frecuencias))))
         barras = ax.bar(range(len(intervalos)), frecuencias, color=colores, edgecolor='black', linewidth=1.5)
         
         # Agregar valores sobre las barras
@@ -390,6 +402,7 @@ class GraficasWidget(QWidget):
         
     def crear_grafica_pastel(self, intervalos, frecuencias):
         """Crea una gráfica de pastel."""
+        _cargar_matplotlib()
         fig = Figure(figsize=(10, 6), facecolor='white')
         ax = fig.add_subplot(111)
         
@@ -397,7 +410,7 @@ class GraficasWidget(QWidget):
         total = sum(frecuencias)
         
         # Crear gráfica de pastel sin etiquetas superpuestas
-        colores = plt.cm.Set3(range(len(frecuencias)))
+        colores = cm.Set3(range(len(frecuencias)))
         
         # Función para mostrar porcentaje solo si es mayor a 3%
         def autopct_format(pct):
@@ -445,6 +458,7 @@ class GraficasWidget(QWidget):
         
     def crear_grafica_puntos(self, marcas_clase, frecuencias, resultados):
         """Crea una gráfica de puntos (dispersión) con líneas."""
+        _cargar_matplotlib()
         fig = Figure(figsize=(12, 4), facecolor='white')
         ax = fig.add_subplot(111)
         
@@ -508,6 +522,7 @@ class GraficasWidget(QWidget):
     
     def crear_histograma(self, limites_inf, limites_sup, frecuencias, marcas_clase):
         """Crea un histograma con barras continuas."""
+        _cargar_matplotlib()
         fig = Figure(figsize=(12, 6), facecolor='white')
         ax = fig.add_subplot(111)
         
@@ -515,7 +530,7 @@ class GraficasWidget(QWidget):
         limites = limites_inf + [limites_sup[-1]]  # Agregar el último límite superior
         
         # Crear histograma con barras
-        colores = plt.cm.Oranges(range(100, 250, int(150/len(frecuencias))))
+        colores = cm.Oranges(range(100, 250, int(150/len(frecuencias))))
         
         # Dibujar las barras del histograma
         for i, (li, ls, freq) in enumerate(zip(limites_inf, limites_sup, frecuencias)):
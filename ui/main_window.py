@@ -3,13 +3,16 @@ Ventana principal de la aplicación.
 """
 
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
-                              QSplitter, QMessageBox, QMenuBar, QMenu)
-from PyQt6.QtCore import Qt
+                              QSplitter, QMessageBox, QMenuBar, QMenu, QFileDialog,
+                              QInputDialog, QProgressDialog, QApplication)
+from PyQt6.QtCore import Qt, QThread
 from PyQt6.QtGui import QAction, QIcon
 from .data_input_widget import DataInputWidget
 from .results_tabs import ResultsTabs
-from core.estadistica import AnalizadorEstadistico
+from .trabajador_analisis import TrabajadorAnalisis
+from core.cache import CacheResultados
 import os
+import zipfile
 
 
 class MainWindow(QMainWindow):
@@ -17,6 +20,12 @@ class MainWindow(QMainWindow):
     
     def __init__(self):
         super().__init__()
+        # Caché de resultados para no recalcular datos ya analizados
+        self.cache = CacheResultados()
+        # Análisis en curso (hilo, trabajador y diálogo de progreso)
+        self.hilo = None
+        self.trabajador = None
+        self.dialogo_progreso = None
         self.setupUI()
         self.connectSignals()
         
@@ -85,18 +94,18 @@ class MainWindow(QMainWindow):
                 font-size: 11pt;
                 font-weight: bold;
             }
-            QTableWidget {
+            QTableView {
                 border: 2px solid #2196F3;
                 gridline-color: #cccccc;
                 background-color: white;
                 color: #000000;
                 font-size: 11pt;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
                 color: #000000;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #BBDEFB;
                 color: #000000;
             }
@@ -159,6 +168,13 @@ class MainWindow(QMainWindow):
         # Menú Archivo
         menu_archivo = menubar.addMenu("Archivo")
         
+        action_importar = QAction("Importar datos...", self)
+        action_importar.setShortcut("Ctrl+O")
+        action_importar.triggered.connect(self.importar_archivo)
+        menu_archivo.addAction(action_importar)
+        
+        menu_archivo.addSeparator()
+        
         action_salir = QAction("Salir", self)
         action_salir.setShortcut("Ctrl+Q")
         action_salir.triggered.connect(self.close)
@@ -175,43 +191,187 @@ class MainWindow(QMainWindow):
         """Conecta las señales de los widgets."""
         self.data_input.dataReady.connect(self.procesar_datos)
         
+    def importar_archivo(self):
+        """Importa una columna numérica de un archivo CSV, Excel o Parquet y la procesa."""
+        # Se importa al usarlo para no cargar pandas al iniciar la aplicación
+        from core.importacion import FILTRO_ARCHIVOS, columnas_archivo, importar_columna
+        
+        ruta, _ = QFileDialog.getOpenFileName(self, "Importar datos", "", FILTRO_ARCHIVOS)
+        if not ruta:
+            return
+        
+        try:
+            # Elegir la columna si el archivo tiene varias
+            columnas = columnas_archivo(ruta)
+            columna = columnas[0]
+            if len(columnas) > 1:
+                columna, aceptado = QInputDialog.getItem(
+                    self, "Seleccionar columna", "Columna a analizar:", columnas, 0, False
+                )
+                if not aceptado:
+                    return
+            
+            # Lectura por bloques mostrando el avance
+            dialogo = QProgressDialog("Importando datos...", None, 0, 100, self)
+            dialogo.setWindowTitle("Importar datos")
+            dialogo.setWindowModality(Qt.WindowModality.WindowModal)
+            dialogo.setMinimumDuration(0)
+            
+            def progreso(filas: int, fraccion: float):
+                dialogo.setLabelText(f"Filas leídas: {filas:,}")
+                dialogo.setValue(int(fraccion * 100))
+                QApplication.processEvents()
+            
+            try:
+                datos, resumen = importar_columna(ruta, columna, progreso=progreso)
+            finally:
+                dialogo.close()
+                
+        except (OSError, ValueError, ImportError, zipfile.BadZipFile) as e:
+            QMessageBox.critical(
+                self,
+                "Error al importar",
+                f"No se pudo importar el archivo:\n{str(e)}"
+            )
+            return
+        
+        self.statusBar().showMessage(
+            f"{os.path.basename(ruta)} [{columna}]: {resumen['filas_leidas']:,} filas leídas, "
+            f"{resumen['filas_validas']:,} numéricas, {resumen['filas_descartadas']:,} descartadas"
+        )
+        
+        if resumen['filas_validas'] < 5:
+            QMessageBox.warning(
+                self,
+                "Datos insuficientes",
+                f"Se necesitan al menos 5 datos. La columna '{columna}' tiene "
+                f"{resumen['filas_validas']} valores numéricos."
+            )
+            return
+        
+        self.procesar_datos(datos)
+        
     def procesar_datos(self, datos: list):
         """
-        Procesa los datos ingresados y muestra los resultados.
+        Inicia el análisis de los datos en un hilo de trabajo.
+        
+        La interfaz sigue respondiendo mientras se calcula; el avance de cada
+        fase se muestra en un diálogo con botón Cancelar y los resultados se
+        muestran al recibir la señal de que están listos.
         
         Args:
-            datos: Lista de valores numéricos validados
+            datos: Arreglo (o lista) de valores numéricos validados
         """
+        if self.hilo is not None:
+            self.statusBar().showMessage("Ya hay un análisis en curso.")
+            return
+        
+        self.n_datos = len(datos)
+        self.trabajador = TrabajadorAnalisis(datos, self.cache)
+        self.hilo = QThread(self)
+        self.trabajador.moveToThread(self.hilo)
+        
+        # Diálogo de avance con botón Cancelar
+        self.dialogo_progreso = QProgressDialog("Iniciando análisis...", "Cancelar", 0, 100, self)
+        self.dialogo_progreso.setWindowTitle("Analizando datos")
+        self.dialogo_progreso.setWindowModality(Qt.WindowModality.WindowModal)
+        self.dialogo_progreso.setMinimumDuration(300)
+        self.dialogo_progreso.setAutoClose(False)
+        self.dialogo_progreso.setAutoReset(False)
+        self.dialogo_progreso.canceled.connect(self.cancelar_analisis)
+        
+        # Las señales del trabajador llegan en cola al hilo de la interfaz
+        self.hilo.started.connect(self.trabajador.ejecutar)
+        self.trabajador.progreso.connect(self.mostrar_progreso)
+        self.trabajador.terminado.connect(self.mostrar_resultados)
+        self.trabajador.fallido.connect(self.mostrar_error_calculo)
+        self.trabajador.cancelado.connect(self.analisis_cancelado)
+        for senal in (self.trabajador.terminado, self.trabajador.fallido,
+                      self.trabajador.cancelado):
+            senal.connect(self.hilo.quit)
+        self.hilo.finished.connect(self.finalizar_analisis)
+        
+        self.statusBar().showMessage(f"Analizando {self.n_datos:,} datos...")
+        self.hilo.start()
+        
+    def mostrar_progreso(self, porcentaje: int, texto: str):
+        """Actualiza el diálogo de avance con la fase en curso."""
+        if self.dialogo_progreso is not None and not self.dialogo_progreso.wasCanceled():
+            self.dialogo_progreso.setLabelText(texto)
+            self.dialogo_progreso.setValue(porcentaje)
+        
+    def cancelar_analisis(self):
+        """Pide al trabajador que detenga el cálculo en curso."""
+        # Al cerrar el diálogo también se emite canceled; solo cuenta si sigue abierto
+        if self.trabajador is not None and self.dialogo_progreso is not None:
+            self.trabajador.cancelar()
+            self.statusBar().showMessage("Cancelando análisis...")
+        
+    def mostrar_resultados(self, resultados: dict):
+        """Muestra los resultados que el trabajador terminó de calcular."""
+        self._cerrar_dialogo_progreso()
+        
         try:
-            # Crear analizador estadístico
-            analizador = AnalizadorEstadistico(datos)
-            
-            # Calcular todo
-            analizador.calcular_todo()
-            
-            # Obtener resultados paso a paso
-            resultados = analizador.obtener_paso_a_paso()
-            
             # Actualizar pestañas de resultados
             self.results_tabs.updateResults(resultados)
             
             # Cambiar a la primera pestaña de resultados
             self.results_tabs.setCurrentIndex(0)
+            self.statusBar().showMessage(f"Análisis completado: {self.n_datos:,} datos.")
             
             # Mostrar mensaje de éxito
             QMessageBox.information(
                 self,
                 "Cálculos completados",
-                f"Se han procesado {len(datos)} datos exitosamente.\n"
+                f"Se han procesado {self.n_datos} datos exitosamente.\n"
                 "Revise las pestañas para ver los resultados detallados."
             )
             
         except Exception as e:
+            # Una excepción sin capturar en un slot aborta el proceso en PyQt6
+            self.statusBar().clearMessage()
             QMessageBox.critical(
                 self,
                 "Error en el cálculo",
-                f"Ocurrió un error al procesar los datos:\n{str(e)}"
+                f"Ocurrió un error al mostrar los resultados:\n{str(e)}"
             )
+        
+    def mostrar_error_calculo(self, mensaje: str):
+        """Informa un error ocurrido durante el cálculo."""
+        self._cerrar_dialogo_progreso()
+        self.statusBar().clearMessage()
+        QMessageBox.critical(
+            self,
+            "Error en el cálculo",
+            f"Ocurrió un error al procesar los datos:\n{mensaje}"
+        )
+        
+    def analisis_cancelado(self):
+        """Informa que el análisis se detuvo sin modificar los resultados mostrados."""
+        self._cerrar_dialogo_progreso()
+        self.statusBar().showMessage("Análisis cancelado.")
+        
+    def finalizar_analisis(self):
+        """Libera el hilo y el trabajador cuando el hilo termina."""
+        self.hilo.deleteLater()
+        self.trabajador.deleteLater()
+        self.hilo = None
+        self.trabajador = None
+        
+    def _cerrar_dialogo_progreso(self):
+        """Cierra el diálogo de avance del análisis."""
+        dialogo, self.dialogo_progreso = self.dialogo_progreso, None
+        if dialogo is not None:
+            dialogo.close()
+            dialogo.deleteLater()
+        
+    def closeEvent(self, event):
+        """Detiene el análisis en curso antes de cerrar la ventana."""
+        if self.hilo is not None:
+            self.trabajador.cancelar()
+            self.hilo.quit()
+            self.hilo.wait()
+        super().closeEvent(event)
             
     def mostrar_acerca_de(self):
         """Muestra el diálogo Acerca de."""
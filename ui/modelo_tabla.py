@@ -0,0 +1,174 @@
+"""
+Modelo de tabla sobre arreglos numéricos para mostrar en un QTableView.
+"""
+
+import numpy as np
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtGui import QFont
+
+# Columna del modelo: (título, valores, función que da el texto de un valor)
+Columna = Tuple[str, Sequence, Callable[[Any], str]]
+
+ALINEACION_NUMEROS = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+
+def formato_numero(valor) -> str:
+    """Formato por defecto: 4 decimales para flotantes, enteros sin decimales."""
+    if isinstance(valor, (float, np.floating)):
+        return f"{valor:.4f}"
+    return str(int(valor))
+
+
+class ModeloTablaNumerica(QAbstractTableModel):
+    """
+    Modelo de solo lectura que envuelve columnas de arreglos sin copiarlas.
+
+    El texto de cada celda se genera en data() solo cuando la vista la pide,
+    y QTableView solo pide las filas visibles, de modo que el costo de mostrar
+    la tabla no depende de su tamaño (a diferencia de crear un
+    QTableWidgetItem por celda).
+    """
+
+    def __init__(self, columnas: List[Columna], fila_total: Optional[Sequence[str]] = None,
+                 alineadas_izquierda: Sequence[int] = (), parent=None):
+        """
+        Args:
+            columnas: Lista de (título, valores, formato) con valores de igual
+                      longitud (arreglos, rangos o listas)
+            fila_total: Textos ya formateados de una fila final de totales,
+                        que se muestra en negrita (opcional)
+            alineadas_izquierda: Índices de las columnas de texto; las demás
+                                 se alinean a la derecha
+            parent: Objeto dueño del modelo (normalmente la vista)
+        """
+        super().__init__(parent)
+        self.titulos = [titulo for titulo, _, _ in columnas]
+        self.valores = [valores for _, valores, _ in columnas]
+        self.formatos = [formato for _, _, formato in columnas]
+        self.filas = len(self.valores[0]) if self.valores else 0
+        self.fila_total = list(fila_total) if fila_total is not None else None
+        self.alineadas_izquierda = set(alineadas_izquierda)
+        self._fuente_total = QFont()
+        self._fuente_total.setBold(True)
+
+    @classmethod
+    def desde_dataframe(cls, df, formato: Callable[[Any], str] = formato_numero,
+                        parent=None) -> 'ModeloTablaNumerica':
+        """
+        Crea el modelo con las columnas de un DataFrame numérico.
+
+        Args:
+            df: DataFrame de pandas
+            formato: Función de formato para todas las columnas
+            parent: Objeto dueño del modelo
+
+        Returns:
+            Instancia de ModeloTablaNumerica
+        """
+        return cls([(str(c), df[c].to_numpy(), formato) for c in df.columns], parent=parent)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Cantidad de filas (incluida la de totales)."""
+        if parent.isValid():
+            return 0
+        return self.filas + (1 if self.fila_total is not None else 0)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Cantidad de columnas."""
+        if parent.isValid():
+            return 0
+        return len(self.titulos)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Devuelve el texto, la alineación o la fuente de una celda."""
+        if not index.isValid():
+            return None
+        fila, columna = index.row(), index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if fila == self.filas:
+                return self.fila_total[columna]
+            return self.formatos[columna](self.valores[columna][fila])
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if columna in self.alineadas_izquierda:
+                return None
+            return ALINEACION_NUMEROS
+        if role == Qt.ItemDataRole.FontRole and fila == self.filas:
+            return self._fuente_total
+        return None
+
+    def headerData(self, seccion: int, orientacion: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):
+        """Títulos de las columnas y número de fila (desde 1)."""
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientacion == Qt.Orientation.Horizontal:
+            return self.titulos[seccion]
+        return str(seccion + 1)
+
+
+class ModeloDatosOrdenados(QAbstractTableModel):
+    """
+    Cuadrícula de solo lectura con los datos ordenados, en filas de valores
+    consecutivos.
+
+    Igual que ModeloTablaNumerica, solo se formatean las celdas visibles: un
+    millón de datos no genera ningún texto hasta que la vista lo muestra.
+    El encabezado de cada fila es la posición (desde 1) de su primer valor.
+    """
+
+    # Valores por fila de la cuadrícula
+    COLUMNAS = 10
+
+    def __init__(self, datos: np.ndarray, columnas: int = COLUMNAS, parent=None):
+        """
+        Args:
+            datos: Arreglo con los datos ordenados
+            columnas: Valores por fila
+            parent: Objeto dueño del modelo (normalmente la vista)
+        """
+        super().__init__(parent)
+        self.datos = datos
+        self.columnas = columnas
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Cantidad de filas de la cuadrícula."""
+        if parent.isValid():
+            return 0
+        return -(-len(self.datos) // self.columnas)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Cantidad de valores por fila."""
+        if parent.isValid():
+            return 0
+        return min(self.columnas, len(self.datos))
+
+    def indice_posicion(self, indice: int) -> QModelIndex:
+        """Celda del dato con el índice dado (desde 0)."""
+        return self.index(indice // self.columnas, indice % self.columnas)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Devuelve el texto, la alineación o la posición de una celda."""
+        if not index.isValid():
+            return None
+        indice = index.row() * self.columnas + index.column()
+        if indice >= len(self.datos):
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(float(self.datos[indice]))
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return ALINEACION_NUMEROS
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return f"Posición {indice + 1}"
+        return None
+
+    def headerData(self, seccion: int, orientacion: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):
+        """Desplazamiento de cada columna y posición del primer valor de cada fila."""
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientacion == Qt.Orientation.Horizontal:
+            return f"+{seccion}"
+        return str(seccion * self.columnas + 1)
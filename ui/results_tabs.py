@@ -2,12 +2,17 @@
 Widget con pestañas para mostrar los resultados del análisis estadístico.
 """
 
-from PyQt6.QtWidgets import (QTabWidget, QWidget, QVBoxLayout, QTextEdit, 
-                              QTableWidget, QTableWidgetItem, QLabel, QScrollArea, QHeaderView)
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import (QTabWidget, QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, 
+                              QTableView, QLabel, QScrollArea, QHeaderView, QLineEdit,
+                              QComboBox, QPushButton, QAbstractItemView)
 from PyQt6.QtGui import QFont
-import pandas as pd
-from .graficas_widget import GraficasWidget
+from typing import TYPE_CHECKING
+from .modelo_tabla import ModeloTablaNumerica, ModeloDatosOrdenados
+from core.datos_ordenados import DatosOrdenados
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from core.tabla_frecuencias import TablaFrecuencias
 
 
 class ResultsTabs(QTabWidget):
@@ -39,9 +44,23 @@ class ResultsTabs(QTabWidget):
         self.setup_tab_dispersion()
         self.addTab(self.tab_dispersion, "📉 Dispersión")
         
-        # Pestaña 5: Gráficas
-        self.tab_graficas = GraficasWidget()
-        self.addTab(self.tab_graficas, "📊 Gráficas")
+        # Pestaña 5: Gráficas (el widget se construye al abrir la pestaña)
+        self.contenedor_graficas = QWidget()
+        self.contenedor_graficas.setLayout(QVBoxLayout())
+        self.contenedor_graficas.layout().setContentsMargins(0, 0, 0, 0)
+        self.addTab(self.contenedor_graficas, "📊 Gráficas")
+        self.tab_graficas = None
+        self.datos_graficas = None
+        self.currentChanged.connect(self.al_cambiar_pestana)
+        
+    def al_cambiar_pestana(self, indice: int):
+        """Construye la pestaña de gráficas la primera vez que se abre."""
+        if self.widget(indice) is self.contenedor_graficas and self.tab_graficas is None:
+            from .graficas_widget import GraficasWidget
+            self.tab_graficas = GraficasWidget()
+            self.contenedor_graficas.layout().addWidget(self.tab_graficas)
+            if self.datos_graficas is not None:
+                self.tab_graficas.mostrar_graficas(*self.datos_graficas)
         
     def setup_tab_preliminares(self):
         """Configura la pestaña de cálculos preliminares."""
@@ -57,13 +76,45 @@ class ResultsTabs(QTabWidget):
                 padding: 10px;
             }
         """)
+        self.text_preliminares.setMaximumHeight(330)
         layout.addWidget(self.text_preliminares)
+        
+        # Datos ordenados: cuadrícula virtual (solo se formatean las filas visibles)
+        self.label_ordenados = QLabel("DATOS ORDENADOS")
+        self.label_ordenados.setStyleSheet("font-weight: bold; padding: 4px;")
+        layout.addWidget(self.label_ordenados)
+        
+        # Búsqueda por posición o por valor (búsqueda binaria)
+        busqueda_layout = QHBoxLayout()
+        self.combo_busqueda = QComboBox()
+        self.combo_busqueda.addItems(["Posición", "Valor"])
+        busqueda_layout.addWidget(self.combo_busqueda)
+        self.edit_busqueda = QLineEdit()
+        self.edit_busqueda.setPlaceholderText("Posición (desde 1) o valor a buscar")
+        self.edit_busqueda.returnPressed.connect(self.buscar_dato)
+        busqueda_layout.addWidget(self.edit_busqueda)
+        btn_buscar = QPushButton("Ir")
+        btn_buscar.setStyleSheet("background-color: #2196F3; color: white; padding: 6px 15px;")
+        btn_buscar.clicked.connect(self.buscar_dato)
+        busqueda_layout.addWidget(btn_buscar)
+        layout.addLayout(busqueda_layout)
+        
+        self.label_busqueda = QLabel("")
+        self.label_busqueda.setStyleSheet("color: #555; padding: 2px;")
+        layout.addWidget(self.label_busqueda)
+        
+        self.vista_ordenados = QTableView()
+        self.vista_ordenados.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.vista_ordenados.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.vista_ordenados)
+        self.datos_ordenados = None
+        
         self.tab_preliminares.setLayout(layout)
         
     def setup_tab_tabla(self):
         """Configura la pestaña de tabla de distribución."""
         layout = QVBoxLayout()
-        self.tabla_widget = QTableWidget()
+        self.tabla_widget = QTableView()
         layout.addWidget(self.tabla_widget)
         self.tab_tabla.setLayout(layout)
         
@@ -103,12 +154,14 @@ class ResultsTabs(QTabWidget):
             resultados: Diccionario con todos los resultados y pasos
         """
         self.mostrar_preliminares(resultados['preliminares'])
-        self.mostrar_tabla(resultados['tabla'])
+        self.mostrar_tabla(resultados['tabla_frecuencias'])
         self.mostrar_tendencia_central(resultados['tendencia_central'])
         self.mostrar_dispersion(resultados['dispersion'])
         
-        # Mostrar gráficas
-        self.tab_graficas.mostrar_graficas(resultados['tabla'], resultados)
+        # Mostrar gráficas (si la pestaña aún no se abrió, al abrirla)
+        self.datos_graficas = (resultados['tabla'], resultados)
+        if self.tab_graficas is not None:
+            self.tab_graficas.mostrar_graficas(*self.datos_graficas)
         
     def mostrar_preliminares(self, pasos: dict):
         """Muestra los cálculos preliminares paso a paso."""
@@ -116,10 +169,13 @@ class ResultsTabs(QTabWidget):
         texto += "CÁLCULOS PRELIMINARES\n"
         texto += "=" * 60 + "\n\n"
         
-        # Datos ordenados
-        texto += "1. DATOS ORDENADOS:\n"
+        # Datos ordenados: solo un resumen; los valores se ven en la cuadrícula
         datos = pasos['datos_ordenados']
-        texto += f"   {datos}\n\n"
+        if not isinstance(datos, DatosOrdenados):
+            datos = DatosOrdenados(datos)
+        self.mostrar_datos_ordenados(datos)
+        texto += "1. DATOS ORDENADOS:\n"
+        texto += f"   n = {len(datos)} valores (ver la cuadrícula de abajo)\n\n"
         
         # Mínimo y máximo
         texto += "2. VALOR MÍNIMO Y MÁXIMO:\n"
@@ -131,7 +187,7 @@ class ResultsTabs(QTabWidget):
         texto += f"   {pasos['rango_formula']}\n\n"
         
         # Número de clases
-        texto += "4. NÚMERO DE CLASES (Regla de Sturges):\n"
+        texto += f"4. NÚMERO DE CLASES ({pasos['regla_nombre']}):\n"
         texto += f"   {pasos['k_formula']}\n\n"
         
         # Amplitud
@@ -142,42 +198,73 @@ class ResultsTabs(QTabWidget):
         
         self.text_preliminares.setPlainText(texto)
         
-    def mostrar_tabla(self, tabla: pd.DataFrame):
-        """Muestra la tabla de distribución de frecuencias."""
-        # Configurar tabla
-        self.tabla_widget.setRowCount(len(tabla))
-        self.tabla_widget.setColumnCount(len(tabla.columns))
-        self.tabla_widget.setHorizontalHeaderLabels(tabla.columns)
-        
-        # Llenar tabla
-        for i, row in tabla.iterrows():
-            for j, (col_name, valor) in enumerate(row.items()):
-                item = QTableWidgetItem()
-                
-                # Formatear valores
-                if col_name == 'Intervalo':
-                    item.setText(str(valor))
-                elif isinstance(valor, (int, float)) and col_name != 'Li' and col_name != 'Ls':
-                    if col_name in ['hi (Frec. Relativa)', 'hi% (Frec. Relativa %)']:
-                        item.setText(f"{valor:.4f}" if col_name == 'hi (Frec. Relativa)' else f"{valor:.2f}")
-                    elif col_name == 'xi (Marca de Clase)':
-                        item.setText(f"{valor:.2f}")
-                    else:
-                        item.setText(str(int(valor)) if valor == int(valor) else str(valor))
+    def mostrar_datos_ordenados(self, datos: DatosOrdenados):
+        """Muestra los datos ordenados en la cuadrícula virtual."""
+        self.datos_ordenados = datos
+        modelo = ModeloDatosOrdenados(datos.arreglo, parent=self.vista_ordenados)
+        self.vista_ordenados.setModel(modelo)
+        self.label_ordenados.setText(f"DATOS ORDENADOS (n = {len(datos)})")
+        self.label_busqueda.setText("")
+        
+    def buscar_dato(self):
+        """Lleva la cuadrícula a la posición o al valor indicado."""
+        if self.datos_ordenados is None or len(self.datos_ordenados) == 0:
+            return
+        n = len(self.datos_ordenados)
+        texto = self.edit_busqueda.text().strip().replace(',', '.')
+        
+        try:
+            if self.combo_busqueda.currentText() == "Posición":
+                posicion = int(texto)
+                if not 1 <= posicion <= n:
+                    self.label_busqueda.setText(f"La posición debe estar entre 1 y {n}.")
+                    return
+                indice = posicion - 1
+                mensaje = f"Posición {posicion}: {float(self.datos_ordenados[indice])}"
+            else:
+                valor = float(texto)
+                indice = self.datos_ordenados.posicion(valor)
+                if indice == n:
+                    indice = n - 1
+                    mensaje = f"Todos los datos son menores que {valor}; último dato en la posición {n}."
+                elif self.datos_ordenados[indice] == valor:
+                    mensaje = f"{valor} aparece por primera vez en la posición {indice + 1}."
                 else:
-                    item.setText(str(valor) if valor != '' else '')
-                
-                # Alinear a la derecha los números
-                if col_name != 'Intervalo':
-                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                
-                # Resaltar fila de totales
-                if i == len(tabla) - 1:
-                    font = item.font()
-                    font.setBold(True)
-                    item.setFont(font)
-                
-                self.tabla_widget.setItem(i, j, item)
+                    mensaje = (f"{valor} no está en los datos; el siguiente mayor es "
+                               f"{float(self.datos_ordenados[indice])} (posición {indice + 1}).")
+        except ValueError:
+            self.label_busqueda.setText(f"'{self.edit_busqueda.text()}' no es un número válido.")
+            return
+        
+        celda = self.vista_ordenados.model().indice_posicion(indice)
+        self.vista_ordenados.setCurrentIndex(celda)
+        self.vista_ordenados.scrollTo(celda, QAbstractItemView.ScrollHint.PositionAtCenter)
+        self.label_busqueda.setText(mensaje)
+        
+    def mostrar_tabla(self, tabla: 'TablaFrecuencias'):
+        """
+        Muestra la tabla de distribución de frecuencias.
+        
+        El modelo envuelve los arreglos de la tabla y formatea solo las
+        celdas visibles, por lo que el tiempo no depende del número de clases.
+        """
+        modelo = ModeloTablaNumerica(
+            [
+                ('Intervalo', range(tabla.k), tabla.intervalo),
+                ('Li', tabla.li, lambda v: str(float(v))),
+                ('Ls', tabla.ls, lambda v: str(float(v))),
+                ('xi (Marca de Clase)', tabla.xi, lambda v: f"{v:.2f}"),
+                ('fi (Frec. Absoluta)', tabla.fi, lambda v: str(int(v))),
+                ('Fi (Frec. Acumulada)', tabla.Fi, lambda v: str(int(v))),
+                ('hi (Frec. Relativa)', tabla.hi, lambda v: f"{v:.4f}"),
+                ('hi% (Frec. Relativa %)', tabla.hi_porcentaje, lambda v: f"{v:.2f}")
+            ],
+            fila_total=['TOTAL', '', '', '', str(tabla.n), '',
+                        f"{tabla.total_hi:.4f}", f"{tabla.total_hi_porcentaje:.2f}"],
+            alineadas_izquierda=[0],
+            parent=self.tabla_widget
+        )
+        self.tabla_widget.setModel(modelo)
         
         # Ajustar columnas al ancho disponible, pero permitir redimensionado manual
         self.tabla_widget.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
@@ -193,11 +280,18 @@ class ResultsTabs(QTabWidget):
         self.tabla_widget.setColumnWidth(6, 165)  # hi (Frec. Relativa)
         # La última columna (hi%) se estirará automáticamente
         
+    def limpiar_layout(self, layout):
+        """Quita todos los elementos de un layout (widgets y espaciadores)."""
+        while layout.count():
+            item = layout.takeAt(0)
+            widget = item.widget()
+            if widget is not None:
+                widget.setParent(None)
+        
     def mostrar_tendencia_central(self, tc: dict):
         """Muestra las medidas de tendencia central con sus pasos."""
         # Limpiar layout anterior
-        for i in reversed(range(self.layout_tendencia.count())):
-            self.layout_tendencia.itemAt(i).widget().setParent(None)
+        self.limpiar_layout(self.layout_tendencia)
         
         # MEDIA
         self.agregar_seccion_media(tc['media'])
@@ -229,18 +323,7 @@ class ResultsTabs(QTabWidget):
         
         # Tabla de cálculos
         tabla_df = pasos_media['tabla']
-        tabla = QTableWidget()
-        tabla.setRowCount(len(tabla_df))
-        tabla.setColumnCount(len(tabla_df.columns))
-        tabla.setHorizontalHeaderLabels(tabla_df.columns)
-        
-        for i, row in tabla_df.iterrows():
-            for j, valor in enumerate(row):
-                item = QTableWidgetItem(f"{valor:.4f}" if isinstance(valor, float) else str(int(valor)))
-                item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                tabla.setItem(i, j, item)
-        
-        tabla.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        tabla = self.crear_tabla_from_df(tabla_df)
         tabla.setMaximumHeight(200)
         self.layout_tendencia.addWidget(tabla)
         
@@ -345,8 +428,7 @@ class ResultsTabs(QTabWidget):
     def mostrar_dispersion(self, disp: dict):
         """Muestra las medidas de dispersión con sus pasos."""
         # Limpiar layout anterior
-        for i in reversed(range(self.layout_dispersion.count())):
-            self.layout_dispersion.itemAt(i).widget().setParent(None)
+        self.limpiar_layout(self.layout_dispersion)
         
         # DESVIACIÓN MEDIA
         self.agregar_seccion_desviacion_media(disp['desviacion_media'])
@@ -434,19 +516,10 @@ class ResultsTabs(QTabWidget):
         resultado.setStyleSheet("color: #263238; background-color: #ECEFF1; padding: 8px; border-left: 4px solid #546E7A;")
         self.layout_dispersion.addWidget(resultado)
         
-    def crear_tabla_from_df(self, df: pd.DataFrame) -> QTableWidget:
-        """Crea un QTableWidget desde un DataFrame."""
-        tabla = QTableWidget()
-        tabla.setRowCount(len(df))
-        tabla.setColumnCount(len(df.columns))
-        tabla.setHorizontalHeaderLabels(df.columns)
-        
-        for i, row in df.iterrows():
-            for j, valor in enumerate(row):
-                texto = f"{valor:.4f}" if isinstance(valor, float) else str(int(valor))
-                item = QTableWidgetItem(texto)
-                item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                tabla.setItem(i, j, item)
+    def crear_tabla_from_df(self, df: 'pd.DataFrame') -> QTableView:
+        """Crea una vista de tabla sobre las columnas de un DataFrame."""
+        tabla = QTableView()
+        tabla.setModel(ModeloTablaNumerica.desde_dataframe(df, parent=tabla))
         
         # Ajustar columnas al ancho disponible
         tabla.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
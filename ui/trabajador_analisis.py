@@ -0,0 +1,79 @@
+"""
+Trabajador que ejecuta el análisis estadístico fuera del hilo de la interfaz.
+"""
+
+import threading
+from PyQt6.QtCore import QObject, pyqtSignal
+
+# Rango de la barra de progreso (en %) y texto de cada fase del cálculo
+FASES_PROGRESO = {
+    'parametros': (0, 10, "Calculando parámetros de agrupación..."),
+    'conteo': (10, 80, "Contando frecuencias por clase..."),
+    'tendencia': (80, 90, "Calculando medidas de tendencia central..."),
+    'dispersion': (90, 100, "Calculando medidas de dispersión...")
+}
+
+
+class TrabajadorAnalisis(QObject):
+    """
+    Ejecuta calcular_todo y obtener_paso_a_paso en un QThread.
+
+    Los resultados solo llegan a la interfaz por señales, cuando ya están
+    completos. La cancelación se marca desde el hilo de la interfaz y se
+    comprueba en cada aviso de progreso (en el conteo, después de cada
+    bloque de datos).
+    """
+
+    progreso = pyqtSignal(int, str)     # Porcentaje total y texto de la fase
+    terminado = pyqtSignal(object)      # Resultados paso a paso
+    fallido = pyqtSignal(str)           # Mensaje de error
+    cancelado = pyqtSignal()
+
+    def __init__(self, datos, cache=None):
+        """
+        Args:
+            datos: Arreglo (o lista) de valores numéricos validados
+            cache: Caché de resultados compartida con la ventana
+        """
+        super().__init__()
+        self.datos = datos
+        self.cache = cache
+        self._cancelar = threading.Event()
+
+    def cancelar(self):
+        """Pide detener el cálculo (se puede llamar desde cualquier hilo)."""
+        self._cancelar.set()
+
+    def ejecutar(self):
+        """Realiza el análisis completo y emite la señal correspondiente."""
+        # core.estadistica (y con él pandas) se importa en el primer análisis,
+        # dentro del hilo de trabajo, y no al abrir la ventana
+        from core.estadistica import AnalizadorEstadistico, CalculoCancelado
+        try:
+            analizador = AnalizadorEstadistico(self.datos, cache=self.cache,
+                                               progreso=self._avanzar)
+            analizador.calcular_todo()
+            resultados = analizador.obtener_paso_a_paso()
+            # Ordenar aquí (no en el hilo de la interfaz) los datos de la
+            # pestaña de preliminares
+            resultados['preliminares']['datos_ordenados'].arreglo
+        except CalculoCancelado:
+            self.cancelado.emit()
+            return
+        except Exception as e:
+            self.fallido.emit(str(e))
+            return
+        # La cancelación pedida durante el ordenamiento o los pasos finales
+        # (sin avisos de progreso) también descarta los resultados
+        if self._cancelar.is_set():
+            self.cancelado.emit()
+            return
+        self.terminado.emit(resultados)
+
+    def _avanzar(self, fase: str, fraccion: float):
+        """Convierte el avance de una fase en porcentaje total y lo emite."""
+        if self._cancelar.is_set():
+            from core.estadistica import CalculoCancelado
+            raise CalculoCancelado()
+        inicio, fin, texto = FASES_PROGRESO[fase]
+        self.progreso.emit(int(inicio + (fin - inicio) * fraccion), texto)